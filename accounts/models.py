@@ -1,15 +1,16 @@
 import uuid
 
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 from django.utils.translation import gettext_lazy as _
 from django.conf import settings
 from django.utils import timezone
-from django.db.models.signals import post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 
 from datetime import timedelta
 
+from ecoLoop.pagination import bump_count_version
 from products.models import Product
 
 
@@ -106,6 +107,16 @@ class User(AbstractUser):
     def get_full_name(self):
         return self.full_name
 
+    def get_role_names(self):
+        """
+        Names of the user's roles, loaded once per user instance (one
+        request) so repeated permission checks share a single query.
+        Never cached across requests: a revoked role must stop working at once.
+        """
+        if not hasattr(self, "_role_names"):
+            self._role_names = frozenset(self.roles.values_list("name", flat=True))
+        return self._role_names
+
 
 class UserProfile(models.Model):
     user = models.OneToOneField(
@@ -200,6 +211,13 @@ def create_user_profile(sender, instance, created, **kwargs):
         UserProfile.objects.get_or_create(user=instance)
 
 
+@receiver(m2m_changed, sender=User.roles.through)
+def clear_role_names(sender, instance, action, reverse, **kwargs):
+    """Forget the memoised role names of a user whose roles just changed."""
+    if action in ("post_add", "post_remove", "post_clear") and not reverse:
+        instance.__dict__.pop("_role_names", None)
+
+
 class RoleApplication(models.Model):
 
     STATUS_CHOICES = [
@@ -409,3 +427,13 @@ class AdminActivityLog(models.Model):
     def __str__(self):
         admin_name = self.admin.full_name if self.admin else "System"
         return f"{admin_name} - {self.get_action_display()} - {self.target_name}"
+
+
+@receiver([post_save, post_delete], sender=User)
+@receiver([post_save, post_delete], sender=UserProfile)
+@receiver([post_save, post_delete], sender=RoleApplication)
+@receiver([post_save, post_delete], sender=Report)
+@receiver([post_save, post_delete], sender=AdminActivityLog)
+def bump_account_counts(sender, **kwargs):
+    """Recount the paginated account and admin lists once the write commits."""
+    transaction.on_commit(lambda: bump_count_version(sender))
@@ -52,7 +52,7 @@ class IsNGO(BasePermission):
     def has_permission(self, request, view):
         if not (request.user and request.user.is_authenticated):
             return False
-        return request.user.roles.filter(name="NGO").exists()
+        return "NGO" in request.user.get_role_names()
 
 
 class IsRecycler(BasePermission):
@@ -63,4 +63,4 @@ class IsRecycler(BasePermission):
     def has_permission(self, request, view):
         if not (request.user and request.user.is_authenticated):
             return False
-        return request.user.roles.filter(name="RECYCLER").exists()
+        return "RECYCLER" in request.user.get_role_names()
@@ -60,6 +60,24 @@ class UserSerializer(serializers.ModelSerializer):
         ]
 
 
+class UserDetailsSerializer(serializers.Serializer):
+    """Serializer for displaying user details"""
+
+    id = serializers.UUIDField(read_only=True)
+    full_name = serializers.CharField(read_only=True)
+    email = serializers.EmailField(read_only=True)
+    phone_number = serializers.CharField(read_only=True)
+
+    def to_representation(self, instance):
+        # Nested in every recycler and NGO request row; read the attributes directly
+        return {
+            "id": str(instance.id),
+            "full_name": instance.full_name,
+            "email": instance.email,
+            "phone_number": instance.phone_number,
+        }
+
+
 class UserRegistrationSerializer(serializers.Serializer):
     email = serializers.EmailField(required=True)
     full_name = serializers.CharField(required=True)
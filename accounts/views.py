@@ -547,12 +547,7 @@ class UserViewSet(viewsets.ModelViewSet):
                     ).count(),
                 }
 
-            result = {
-                "count": getattr(self.paginator.page.paginator, "count", len(data)),
-                "next": self.paginator.get_next_link(),
-                "previous": self.paginator.get_previous_link(),
-                "results": data,
-            }
+            result = self.get_paginated_response(data).data
             return api_response(
                 result=result,
                 is_success=True,
@@ -826,12 +821,7 @@ class AdminRoleApplicationViewSet(viewsets.ReadOnlyModelViewSet):
         page = self.paginate_queryset(queryset)
         if page is not None:
             data = self.get_serializer(page, many=True).data
-            result = {
-                "count": getattr(self.paginator.page.paginator, "count", len(data)),
-                "next": self.paginator.get_next_link(),
-                "previous": self.paginator.get_previous_link(),
-                "results": data,
-            }
+            result = self.get_paginated_response(data).data
             return api_response(
                 result=result,
                 is_success=True,
@@ -1052,12 +1042,7 @@ class AdminReportViewSet(viewsets.ModelViewSet):
         if page is not None:
             data = self.get_serializer(page, many=True).data
 
-            result = {
-                "count": getattr(self.paginator.page.paginator, "count", len(data)),
-                "next": self.paginator.get_next_link(),
-                "previous": self.paginator.get_previous_link(),
-                "results": data,
-            }
+            result = self.get_paginated_response(data).data
             return api_response(
                 result=result,
                 is_success=True,
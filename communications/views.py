@@ -214,12 +214,7 @@ class MessageViewSet(viewsets.ModelViewSet):
             page = self.paginate_queryset(queryset)
             if page is not None:
                 serializer = self.get_serializer(page, many=True)
-                result = {
-                    "count": self.paginator.page.paginator.count,
-                    "next": self.paginator.get_next_link(),
-                    "previous": self.paginator.get_previous_link(),
-                    "results": serializer.data,
-                }
+                result = self.get_paginated_response(serializer.data).data
                 return api_response(
                     result=result,
                     is_success=True,
@@ -46,16 +46,21 @@ class Command(BaseCommand):
             },
         ]
 
+        # Load existing rows once so the loop and the summary need no extra queries
+        existing_categories = DonationCategory.objects.in_bulk(field_name="name")
+        existing_conditions = DonationCondition.objects.in_bulk(field_name="name")
+
         # Create categories
         created_categories = 0
         updated_categories = 0
 
         for category_data in categories_data:
-            category, created = DonationCategory.objects.get_or_create(
-                name=category_data["name"],
-                defaults={"description": category_data["description"]},
-            )
-            if created:
+            category = existing_categories.get(category_data["name"])
+            if category is None:
+                category = DonationCategory.objects.create(
+                    name=category_data["name"],
+                    description=category_data["description"],
+                )
                 created_categories += 1
                 self.stdout.write(
                     self.style.SUCCESS(f'✓ Created category: "{category.name}"')
@@ -64,7 +69,7 @@ class Command(BaseCommand):
                 # Update description if different
                 if category.description != category_data["description"]:
                     category.description = category_data["description"]
-                    category.save()
+                    category.save(update_fields=["description"])
                     updated_categories += 1
                     self.stdout.write(
                         self.style.WARNING(f'↻ Updated category: "{category.name}"')
@@ -77,11 +82,12 @@ class Command(BaseCommand):
         updated_conditions = 0
 
         for condition_data in conditions_data:
-            condition, created = DonationCondition.objects.get_or_create(
-                name=condition_data["name"],
-                defaults={"description": condition_data["description"]},
-            )
-            if created:
+            condition = existing_conditions.get(condition_data["name"])
+            if condition is None:
+                condition = DonationCondition.objects.create(
+                    name=condition_data["name"],
+                    description=condition_data["description"],
+                )
                 created_conditions += 1
                 self.stdout.write(
                     self.style.SUCCESS(f'✓ Created condition: "{condition.name}"')
@@ -90,7 +96,7 @@ class Command(BaseCommand):
                 # Update description if different
                 if condition.description != condition_data["description"]:
                     condition.description = condition_data["description"]
-                    condition.save()
+                    condition.save(update_fields=["description"])
                     updated_conditions += 1
                     self.stdout.write(
                         self.style.WARNING(f'↻ Updated condition: "{condition.name}"')
@@ -98,6 +104,9 @@ class Command(BaseCommand):
                 else:
                     self.stdout.write(f'- Condition already exists: "{condition.name}"')
 
+        total_categories = len(existing_categories) + created_categories
+        total_conditions = len(existing_conditions) + created_conditions
+
         # Summary
         self.stdout.write("\n" + "=" * 50)
         self.stdout.write(
@@ -112,6 +121,6 @@ class Command(BaseCommand):
         )
         self.stdout.write(
             self.style.SUCCESS(
-                f"Total in database: {DonationCategory.objects.count()} categories, {DonationCondition.objects.count()} conditions"
+                f"Total in database: {total_categories} categories, {total_conditions} conditions"
             )
         )
@@ -0,0 +1,23 @@
+# Generated by Django 6.0 on 2026-10-16 06:24
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('donations', '0004_alter_donationrequest_status_ngooffer'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='donationrequest',
+            index=models.Index(fields=['status', '-request_date'], name='donations_d_status_f1775a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='donationrequest',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['-request_date'], name='donation_pending_date_idx'),
+        ),
+    ]
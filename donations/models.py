@@ -1,4 +1,13 @@
-from django.db import models
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from ecoLoop.pagination import bump_count_version
+
+
+DONATION_CATEGORIES_CACHE_KEY = "donations:categories"
+DONATION_CONDITIONS_CACHE_KEY = "donations:conditions"
 
 
 # Create your models here.
@@ -18,6 +27,18 @@ class DonationCondition(models.Model):
         return self.name
 
 
+@receiver([post_save, post_delete], sender=DonationCategory)
+def clear_donation_categories_cache(sender, **kwargs):
+    """Drop the cached category list whenever a category changes."""
+    cache.delete(DONATION_CATEGORIES_CACHE_KEY)
+
+
+@receiver([post_save, post_delete], sender=DonationCondition)
+def clear_donation_conditions_cache(sender, **kwargs):
+    """Drop the cached condition list whenever a condition changes."""
+    cache.delete(DONATION_CONDITIONS_CACHE_KEY)
+
+
 class DonationRequest(models.Model):
     STATUS_CHOICES = [
         ("pending", "Pending"),
@@ -46,10 +67,27 @@ class DonationRequest(models.Model):
         max_digits=9, decimal_places=6, blank=True, null=True
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "-request_date"]),
+            # Pending requests are the hot NGO feed; keep their index small
+            models.Index(
+                fields=["-request_date"],
+                condition=models.Q(status="pending"),
+                name="donation_pending_date_idx",
+            ),
+        ]
+
     def __str__(self):
         return f"Donation Request by {self.user.username} for {self.category.name} in {self.condition.name} condition"
 
 
+@receiver([post_save, post_delete], sender=DonationRequest)
+def bump_donation_request_counts(sender, **kwargs):
+    """Recount the paginated donation request lists once the write commits."""
+    transaction.on_commit(lambda: bump_count_version(sender))
+
+
 class DonationImage(models.Model):
     donation = models.ForeignKey(
         DonationRequest,
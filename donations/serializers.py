@@ -1,4 +1,12 @@
+from datetime import timezone as dt_timezone
+
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
+from ecoLoop.fields import BaseURIImageField
+from accounts.serializers import UserDetailsSerializer
 from .models import (
     DonationCategory,
     DonationCondition,
@@ -8,15 +16,6 @@ from .models import (
 )
 
 
-class UserDetailsSerializer(serializers.Serializer):
-    """Serializer for displaying user details"""
-
-    id = serializers.UUIDField(read_only=True)
-    full_name = serializers.CharField(read_only=True)
-    email = serializers.EmailField(read_only=True)
-    phone_number = serializers.CharField(read_only=True)
-
-
 class DonationCategorySerializer(serializers.ModelSerializer):
     class Meta:
         model = DonationCategory
@@ -30,12 +29,61 @@ class DonationConditionSerializer(serializers.ModelSerializer):
 
 
 class DonationImageSerializer(serializers.ModelSerializer):
+    image = BaseURIImageField()
+
     class Meta:
         model = DonationImage
         fields = ["id", "image", "uploaded_at"]
         read_only_fields = ["id", "uploaded_at"]
 
 
+def images_json_to_representation(images, request=None):
+    """Render rows of the images_json annotation like DonationImageSerializer"""
+    storage = DonationImage._meta.get_field("image").storage
+    datetime_field = serializers.DateTimeField()
+    data = []
+    for image in images or []:
+        url = storage.url(image["image"]) if image["image"] else None
+        if url and request:
+            url = request.build_absolute_uri(url)
+
+        uploaded_at = parse_datetime(image["uploaded_at"])
+        if timezone.is_naive(uploaded_at):
+            # SQLite stores naive UTC timestamps
+            uploaded_at = timezone.make_aware(uploaded_at, dt_timezone.utc)
+
+        data.append(
+            {
+                "id": image["id"],
+                "image": url,
+                "uploaded_at": datetime_field.to_representation(uploaded_at),
+            }
+        )
+    return data
+
+
+@extend_schema_field(DonationImageSerializer(many=True))
+class DonationImagesField(serializers.Field):
+    """
+    Images of a donation request. Reads the images_json annotation when the
+    queryset provides it and falls back to the images relation otherwise.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs["source"] = "*"
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        if hasattr(value, "images_json"):
+            return images_json_to_representation(
+                value.images_json, self.context.get("request")
+            )
+        return DonationImageSerializer(
+            value.images.all(), many=True, context=self.context
+        ).data
+
+
 class DonationRequestSerializer(serializers.ModelSerializer):
     user = serializers.PrimaryKeyRelatedField(read_only=True)
     request_date = serializers.DateTimeField(read_only=True)
@@ -44,7 +92,7 @@ class DonationRequestSerializer(serializers.ModelSerializer):
     condition_details = DonationConditionSerializer(source="condition", read_only=True)
 
     # Multiple images support
-    images = DonationImageSerializer(many=True, read_only=True)
+    images = DonationImagesField()
     uploaded_images = serializers.ListField(
         child=serializers.ImageField(),
         write_only=True,
@@ -73,14 +121,90 @@ class DonationRequestSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         uploaded_images = validated_data.pop("uploaded_images", [])
-        request = DonationRequest.objects.create(**validated_data)
-        # Create DonationImage instances for each uploaded image
-        for image in uploaded_images:
-            DonationImage.objects.create(donation=request, image=image)
+        with transaction.atomic():
+            request = DonationRequest.objects.create(**validated_data)
+            # Create DonationImage instances for all uploaded images in one INSERT
+            DonationImage.objects.bulk_create(
+                [DonationImage(donation=request, image=image) for image in uploaded_images],
+                batch_size=50,
+            )
 
         return request
 
 
+class DonationRequestValuesSerializer:
+    """
+    Read-only counterpart of DonationRequestSerializer for list pages.
+    Renders the same payload from .values() rows, so no model instances
+    or per-row serializer fields are built.
+    """
+
+    values = (
+        "id",
+        "user_id",
+        "category_id",
+        "category__name",
+        "category__description",
+        "condition_id",
+        "condition__name",
+        "condition__description",
+        "quantity",
+        "notes",
+        "pickup_address",
+        "latitude",
+        "longitude",
+        "request_date",
+        "status",
+        "images_json",
+    )
+
+    datetime_field = serializers.DateTimeField()
+    coordinate_field = serializers.DecimalField(max_digits=9, decimal_places=6)
+
+    def __init__(self, rows, context=None):
+        self.rows = rows
+        self.context = context or {}
+
+    def to_datetime(self, value):
+        return self.datetime_field.to_representation(value) if value else None
+
+    def to_coordinate(self, value):
+        if value is None:
+            return None
+        return self.coordinate_field.to_representation(value)
+
+    @property
+    def data(self):
+        request = self.context.get("request")
+        return [
+            {
+                "id": row["id"],
+                "user": str(row["user_id"]),
+                "category": row["category_id"],
+                "category_details": {
+                    "id": row["category_id"],
+                    "name": row["category__name"],
+                    "description": row["category__description"],
+                },
+                "condition": row["condition_id"],
+                "condition_details": {
+                    "id": row["condition_id"],
+                    "name": row["condition__name"],
+                    "description": row["condition__description"],
+                },
+                "quantity": row["quantity"],
+                "notes": row["notes"],
+                "pickup_address": row["pickup_address"],
+                "latitude": self.to_coordinate(row["latitude"]),
+                "longitude": self.to_coordinate(row["longitude"]),
+                "request_date": self.to_datetime(row["request_date"]),
+                "status": row["status"],
+                "images": images_json_to_representation(row["images_json"], request),
+            }
+            for row in self.rows
+        ]
+
+
 class NGODonationRequestSerializer(serializers.ModelSerializer):
     """Serializer for NGO to view donation requests with user details"""
 
@@ -89,7 +213,7 @@ class NGODonationRequestSerializer(serializers.ModelSerializer):
     status = serializers.CharField(read_only=True)
     category_details = DonationCategorySerializer(source="category", read_only=True)
     condition_details = DonationConditionSerializer(source="condition", read_only=True)
-    images = DonationImageSerializer(many=True, read_only=True)
+    images = DonationImagesField()
 
     class Meta:
         model = DonationRequest
@@ -140,7 +264,7 @@ class NGOAcceptedDonationRequestSerializer(serializers.ModelSerializer):
     status = serializers.CharField(read_only=True)
     category_details = DonationCategorySerializer(source="category", read_only=True)
     condition_details = DonationConditionSerializer(source="condition", read_only=True)
-    images = DonationImageSerializer(many=True, read_only=True)
+    images = DonationImagesField()
     ngo_offers = NGOOfferSerializer(many=True, read_only=True)
 
     class Meta:
@@ -1,3 +1,170 @@
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from accounts.models import Role, User
+from .models import (
+    DonationCategory,
+    DonationCondition,
+    DonationImage,
+    DonationRequest,
+    NGOOffer,
+)
+from .views import annotate_images_json
+
+
+class DonationTestMixin:
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email="donor@example.com",
+            full_name="Donor",
+            phone_number="9800000000",
+            password="pass1234",
+        )
+        cls.category = DonationCategory.objects.create(name="Clothes")
+        cls.condition = DonationCondition.objects.create(name="Good")
+
+    def create_request(self, **kwargs):
+        kwargs.setdefault("user", self.user)
+        return DonationRequest.objects.create(
+            category=self.category,
+            condition=self.condition,
+            quantity="1 bag",
+            notes="Winter clothes",
+            pickup_address="Kathmandu",
+            **kwargs,
+        )
+
+
+class AnnotateImagesJSONTests(DonationTestMixin, TestCase):
+    def test_images_load_as_a_list(self):
+        donation = self.create_request()
+        image = DonationImage.objects.create(
+            donation=donation, image="donations/a.jpg"
+        )
+
+        row = annotate_images_json(DonationRequest.objects.all()).get()
+
+        self.assertEqual(len(row.images_json), 1)
+        self.assertEqual(row.images_json[0]["id"], image.id)
+        self.assertEqual(row.images_json[0]["image"], "donations/a.jpg")
+
+    def test_postgres_aggregates_to_jsonb(self):
+        # psycopg only returns jsonb as text for JSONField to decode
+        query = annotate_images_json(DonationRequest.objects.all()).query
+        inner = query.annotations["images_json"]
+        aggregate = inner.annotations["json"]
+
+        compiler = inner.get_compiler(connection=connection)
+        sql, _ = aggregate.as_postgresql(compiler, connection)
+
+        self.assertTrue(sql.startswith("JSONB_AGG("), sql)
+
+
+class CachedCountPaginationTests(DonationTestMixin, TestCase):
+    url = "/api/donations/requests/"
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            for _ in range(15):
+                self.create_request()
+
+    def get_page(self, page):
+        response = self.client.get(self.url, {"page": page})
+        return response.status_code, response.json()["Result"]
+
+    def test_deeper_pages_see_rows_added_after_page_one(self):
+        self.assertEqual(self.get_page(1)[1]["count"], 15)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            for _ in range(12):
+                self.create_request()
+
+        status_code, result = self.get_page(2)
+        self.assertEqual(status_code, 200)
+        self.assertEqual(result["count"], 27)
+        self.assertIsNotNone(result["next"])
+        self.assertEqual(self.get_page(3)[0], 200)
+
+    def test_page_past_a_stale_count_is_recounted(self):
+        self.assertEqual(self.get_page(1)[1]["count"], 15)
+
+        # bulk_create sends no post_save, so the cached count isn't bumped
+        DonationRequest.objects.bulk_create(
+            DonationRequest(
+                user=self.user,
+                category=self.category,
+                condition=self.condition,
+                quantity="1 bag",
+                notes="Winter clothes",
+                pickup_address="Kathmandu",
+            )
+            for _ in range(12)
+        )
+
+        status_code, result = self.get_page(3)
+        self.assertEqual(status_code, 200)
+        self.assertEqual(result["count"], 27)
+        self.assertEqual(len(result["results"]), 3)
+
+
+class NGOAcceptRequestTests(DonationTestMixin, TestCase):
+    def setUp(self):
+        self.ngo = User.objects.create_user(
+            email="ngo@example.com",
+            full_name="NGO",
+            phone_number="9800000009",
+            password="pass1234",
+        )
+        self.ngo.roles.add(Role.objects.get_or_create(name="NGO")[0])
+        self.client = APIClient()
+        self.client.force_authenticate(self.ngo)
+        self.donation = self.create_request()
+
+    def accept(self, donation_id, **data):
+        data.setdefault("donation_request", donation_id)
+        return self.client.post(
+            f"/api/donations/ngo/pending-requests/{donation_id}/accept/",
+            data,
+            format="json",
+        )
+
+    def test_accept_claims_the_request_and_creates_an_offer(self):
+        response = self.accept(self.donation.id, notes="Pickup on Friday")
+
+        self.assertEqual(response.status_code, 201)
+        self.donation.refresh_from_db()
+        self.assertEqual(self.donation.status, "accepted")
+        offer = NGOOffer.objects.get()
+        self.assertEqual(offer.ngo, self.ngo)
+        self.assertEqual(offer.donation_request, self.donation)
+
+    def test_second_accept_loses_the_claim(self):
+        self.assertEqual(self.accept(self.donation.id).status_code, 201)
+
+        response = self.accept(self.donation.id)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json()["ErrorMessage"],
+            "Cannot accept request with status: accepted",
+        )
+        self.assertEqual(NGOOffer.objects.count(), 1)
+
+    def test_invalid_offer_releases_the_claim(self):
+        response = self.accept(self.donation.id, donation_request=0)
+
+        self.assertEqual(response.status_code, 400)
+        self.donation.refresh_from_db()
+        self.assertEqual(self.donation.status, "pending")
+        self.assertFalse(NGOOffer.objects.exists())
+
+    def test_unknown_request_is_not_found(self):
+        response = self.accept(self.donation.id + 1000)
+
+        self.assertEqual(response.status_code, 404)
@@ -1,18 +1,35 @@
-from django.shortcuts import render
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
-from rest_framework.response import Response
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
-from .models import DonationCategory, DonationCondition, DonationRequest, NGOOffer
+from django.db import transaction
+from django.db.models import OuterRef, Prefetch, Subquery
+from django.db.models.functions import JSONObject
+from .models import (
+    DONATION_CATEGORIES_CACHE_KEY,
+    DONATION_CONDITIONS_CACHE_KEY,
+    DonationCategory,
+    DonationCondition,
+    DonationImage,
+    DonationRequest,
+    NGOOffer,
+)
 from .serializers import (
     DonationCategorySerializer,
     DonationConditionSerializer,
     DonationRequestSerializer,
+    DonationRequestValuesSerializer,
     NGODonationRequestSerializer,
     NGOOfferSerializer,
     NGOAcceptedDonationRequestSerializer,
 )
+from ecoLoop.aggregates import JSONArrayAgg
+from ecoLoop.mixins import (
+    APIResponseMixin,
+    CachedLookupMixin,
+    ReadOnlyAPIResponseMixin,
+)
+from ecoLoop.pagination import bump_count_version
 from ecoLoop.utils import api_response
 from accounts.permissions import IsNGO
 
@@ -20,173 +37,99 @@ from accounts.permissions import IsNGO
 # Create your views here.
 
 
-class DonationCategoryViewSet(viewsets.ModelViewSet):
+# Columns the NGO serializers read; the joined user row is the wide one,
+# so only the fields UserDetailsSerializer shows are loaded from it
+NGO_REQUEST_FIELDS = (
+    "id",
+    "quantity",
+    "notes",
+    "pickup_address",
+    "latitude",
+    "longitude",
+    "request_date",
+    "status",
+    "user__id",
+    "user__full_name",
+    "user__email",
+    "user__phone_number",
+    "category__id",
+    "category__name",
+    "category__description",
+    "condition__id",
+    "condition__name",
+    "condition__description",
+)
+
+
+def annotate_images_json(queryset):
+    """
+    Attach each request's images as one JSON array (images_json) so they are
+    loaded with the main query instead of a separate prefetch.
+    """
+    images = (
+        DonationImage.objects.filter(donation=OuterRef("pk"))
+        .order_by()
+        .values("donation")
+        .annotate(
+            json=JSONArrayAgg(
+                JSONObject(id="id", image="image", uploaded_at="uploaded_at")
+            )
+        )
+        .values("json")
+    )
+    return queryset.annotate(images_json=Subquery(images))
+
+
+class DonationCategoryViewSet(CachedLookupMixin, viewsets.ModelViewSet):
     authentication_classes = []
     permission_classes = [AllowAny]
     queryset = DonationCategory.objects.all()
     serializer_class = DonationCategorySerializer
+    cache_key = DONATION_CATEGORIES_CACHE_KEY
 
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-        serializer = self.get_serializer(queryset, many=True)
-        return api_response(
-            result=serializer.data,
-            is_success=True,
-            status_code=status.HTTP_200_OK,
-        )
-
-    def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
-        serializer = self.get_serializer(instance)
-        return api_response(
-            result=serializer.data,
-            is_success=True,
-            status_code=status.HTTP_200_OK,
-        )
 
-
-class DonationConditionViewSet(viewsets.ModelViewSet):
+class DonationConditionViewSet(CachedLookupMixin, viewsets.ModelViewSet):
     authentication_classes = []
     permission_classes = [AllowAny]
     queryset = DonationCondition.objects.all()
     serializer_class = DonationConditionSerializer
+    cache_key = DONATION_CONDITIONS_CACHE_KEY
 
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-        serializer = self.get_serializer(queryset, many=True)
-        return api_response(
-            result=serializer.data,
-            is_success=True,
-            status_code=status.HTTP_200_OK,
-        )
 
-    def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
-        serializer = self.get_serializer(instance)
-        return api_response(
-            result=serializer.data,
-            is_success=True,
-            status_code=status.HTTP_200_OK,
-        )
-
-
-class DonationRequestViewSet(viewsets.ModelViewSet):
+class DonationRequestViewSet(APIResponseMixin, viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
     serializer_class = DonationRequestSerializer
     parser_classes = (MultiPartParser, FormParser, JSONParser)
 
     def get_queryset(self):
         # Users can only see their own donation requests
-        return DonationRequest.objects.filter(user=self.request.user).prefetch_related(
-            "images"
+        return annotate_images_json(
+            DonationRequest.objects.filter(user=self.request.user).order_by(
+                "-request_date"
+            )
         )
 
     def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            data = self.get_serializer(page, many=True).data
-            result = {
-                "count": getattr(self.paginator.page.paginator, "count", len(data)),
-                "next": self.paginator.get_next_link(),
-                "previous": self.paginator.get_previous_link(),
-                "results": data,
-            }
-            return api_response(
-                result=result,
-                is_success=True,
-                status_code=status.HTTP_200_OK,
-            )
-
-        data = self.get_serializer(queryset, many=True).data
-        return api_response(
-            result=data,
-            is_success=True,
-            status_code=status.HTTP_200_OK,
+        # Read plain rows for the list; images come along as images_json
+        queryset = self.filter_queryset(self.get_queryset()).values(
+            *DonationRequestValuesSerializer.values
         )
-
-    def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
-        serializer = self.get_serializer(instance)
-        return api_response(
-            result=serializer.data,
-            is_success=True,
-            status_code=status.HTTP_200_OK,
+        context = self.get_serializer_context()
+        return self._paginated(
+            queryset,
+            serialize=lambda rows: DonationRequestValuesSerializer(
+                rows, context=context
+            ).data,
         )
 
-    def create(self, request, *args, **kwargs):
-        serializer = self.get_serializer(data=request.data)
-
-        if not serializer.is_valid():
-            return api_response(
-                result=None,
-                is_success=False,
-                error_message=serializer.errors,
-                status_code=status.HTTP_400_BAD_REQUEST,
-            )
-
+    def perform_create(self, serializer):
         # Set the user to the authenticated user
-        serializer.save(user=request.user)
-
-        return api_response(
-            result=serializer.data,
-            is_success=True,
-            status_code=status.HTTP_201_CREATED,
-        )
-
-    def update(self, request, *args, **kwargs):
-        instance = self.get_object()
-        serializer = self.get_serializer(instance, data=request.data, partial=False)
-
-        if not serializer.is_valid():
-            return api_response(
-                result=None,
-                is_success=False,
-                error_message=serializer.errors,
-                status_code=status.HTTP_400_BAD_REQUEST,
-            )
+        serializer.save(user=self.request.user)
 
-        self.perform_update(serializer)
 
-        return api_response(
-            result=serializer.data,
-            is_success=True,
-            status_code=status.HTTP_200_OK,
-        )
-
-    def partial_update(self, request, *args, **kwargs):
-        instance = self.get_object()
-        serializer = self.get_serializer(instance, data=request.data, partial=True)
-
-        if not serializer.is_valid():
-            return api_response(
-                result=None,
-                is_success=False,
-                error_message=serializer.errors,
-                status_code=status.HTTP_400_BAD_REQUEST,
-            )
-
-        self.perform_update(serializer)
-
-        return api_response(
-            result=serializer.data,
-            is_success=True,
-            status_code=status.HTTP_200_OK,
-        )
-
-    def destroy(self, request, *args, **kwargs):
-        instance = self.get_object()
-        self.perform_destroy(instance)
-
-        return api_response(
-            result={"message": "Deleted."},
-            is_success=True,
-            status_code=status.HTTP_204_NO_CONTENT,
-        )
-
-
-class NGODonationRequestViewSet(viewsets.ReadOnlyModelViewSet):
+class NGODonationRequestViewSet(
+    ReadOnlyAPIResponseMixin, viewsets.ReadOnlyModelViewSet
+):
     """
     ViewSet for NGO users to view all pending donation requests.
     NGO can list and retrieve pending donation requests but cannot modify them.
@@ -197,44 +140,11 @@ class NGODonationRequestViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_queryset(self):
         # NGO can see all pending donation requests
-        return (
+        return annotate_images_json(
             DonationRequest.objects.filter(status="pending")
-            .prefetch_related("images")
             .select_related("user", "category", "condition")
-        )
-
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            data = self.get_serializer(page, many=True).data
-            result = {
-                "count": getattr(self.paginator.page.paginator, "count", len(data)),
-                "next": self.paginator.get_next_link(),
-                "previous": self.paginator.get_previous_link(),
-                "results": data,
-            }
-            return api_response(
-                result=result,
-                is_success=True,
-                status_code=status.HTTP_200_OK,
-            )
-
-        data = self.get_serializer(queryset, many=True).data
-        return api_response(
-            result=data,
-            is_success=True,
-            status_code=status.HTTP_200_OK,
-        )
-
-    def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
-        serializer = self.get_serializer(instance)
-        return api_response(
-            result=serializer.data,
-            is_success=True,
-            status_code=status.HTTP_200_OK,
+            .only(*NGO_REQUEST_FIELDS)
+            .order_by("-request_date")
         )
 
     @action(detail=True, methods=["post"], url_path="accept")
@@ -243,45 +153,55 @@ class NGODonationRequestViewSet(viewsets.ReadOnlyModelViewSet):
         NGO accepts a donation request and creates an offer.
         This changes the request status to 'accepted' and creates an NGO offer.
         """
-        # Get the donation request without status filter to check if it exists
-        try:
-            donation_request = DonationRequest.objects.get(id=pk)
-        except DonationRequest.DoesNotExist:
-            return api_response(
-                result=None,
-                is_success=False,
-                error_message="Donation request not found",
-                status_code=status.HTTP_404_NOT_FOUND,
-            )
-
-        # Check if request is still pending
-        if donation_request.status != "pending":
-            return api_response(
-                result=None,
-                is_success=False,
-                error_message=f"Cannot accept request with status: {donation_request.status}",
-                status_code=status.HTTP_400_BAD_REQUEST,
+        with transaction.atomic():
+            # Claim the request: only one concurrent accept can flip it from pending
+            claimed = DonationRequest.objects.filter(id=pk, status="pending").update(
+                status="accepted"
             )
-
-        # Create the offer
-        offer_serializer = NGOOfferSerializer(data=request.data)
-        if not offer_serializer.is_valid():
-            return api_response(
-                result=None,
-                is_success=False,
-                error_message=offer_serializer.errors,
-                status_code=status.HTTP_400_BAD_REQUEST,
+            if not claimed:
+                current_status = (
+                    DonationRequest.objects.filter(id=pk)
+                    .values_list("status", flat=True)
+                    .first()
+                )
+                if current_status is None:
+                    return api_response(
+                        result=None,
+                        is_success=False,
+                        error_message="Donation request not found",
+                        status_code=status.HTTP_404_NOT_FOUND,
+                    )
+                return api_response(
+                    result=None,
+                    is_success=False,
+                    error_message=f"Cannot accept request with status: {current_status}",
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                )
+            # QuerySet.update() sends no post_save
+            transaction.on_commit(lambda: bump_count_version(DonationRequest))
+
+            # Create the offer
+            offer_serializer = NGOOfferSerializer(data=request.data)
+            if not offer_serializer.is_valid():
+                # Undo the claim
+                transaction.set_rollback(True)
+                return api_response(
+                    result=None,
+                    is_success=False,
+                    error_message=offer_serializer.errors,
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                )
+
+            # Load everything the response serializer needs in one query
+            donation_request = annotate_images_json(
+                DonationRequest.objects.select_related("user", "category", "condition")
+            ).get(id=pk)
+
+            # Save the offer
+            offer = offer_serializer.save(
+                ngo=request.user, donation_request=donation_request
             )
 
-        # Update request status
-        donation_request.status = "accepted"
-        donation_request.save()
-
-        # Save the offer
-        offer = offer_serializer.save(
-            ngo=request.user, donation_request=donation_request
-        )
-
         return api_response(
             result={
                 "message": "Donation request accepted successfully",
@@ -293,7 +213,9 @@ class NGODonationRequestViewSet(viewsets.ReadOnlyModelViewSet):
         )
 
 
-class NGOAcceptedDonationRequestViewSet(viewsets.ReadOnlyModelViewSet):
+class NGOAcceptedDonationRequestViewSet(
+    ReadOnlyAPIResponseMixin, viewsets.ReadOnlyModelViewSet
+):
     """
     ViewSet for NGO users to view accepted donation requests.
     NGO can list and retrieve accepted donation requests with offer details.
@@ -304,42 +226,14 @@ class NGOAcceptedDonationRequestViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_queryset(self):
         # NGO can see all accepted donation requests
-        return (
+        return annotate_images_json(
             DonationRequest.objects.filter(status="accepted")
-            .prefetch_related("images", "ngo_offers")
-            .select_related("user", "category", "condition")
-        )
-
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            data = self.get_serializer(page, many=True).data
-            result = {
-                "count": getattr(self.paginator.page.paginator, "count", len(data)),
-                "next": self.paginator.get_next_link(),
-                "previous": self.paginator.get_previous_link(),
-                "results": data,
-            }
-            return api_response(
-                result=result,
-                is_success=True,
-                status_code=status.HTTP_200_OK,
+            .prefetch_related(
+                # NGOOfferSerializer only reads ngo/donation_request ids,
+                # so the offers need no joins
+                Prefetch("ngo_offers", queryset=NGOOffer.objects.order_by("id"))
             )
-
-        data = self.get_serializer(queryset, many=True).data
-        return api_response(
-            result=data,
-            is_success=True,
-            status_code=status.HTTP_200_OK,
-        )
-
-    def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
-        serializer = self.get_serializer(instance)
-        return api_response(
-            result=serializer.data,
-            is_success=True,
-            status_code=status.HTTP_200_OK,
+            .select_related("user", "category", "condition")
+            .only(*NGO_REQUEST_FIELDS)
+            .order_by("-request_date")
         )
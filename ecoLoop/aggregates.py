@@ -0,0 +1,29 @@
+from django.db.models import Aggregate, JSONField
+
+
+class JSONArrayAgg(Aggregate):
+    """
+    Aggregate rows into a JSON array on any supported backend.
+    Postgres uses JSONB_AGG, SQLite JSON_GROUP_ARRAY and MySQL JSON_ARRAYAGG.
+    Postgres needs the jsonb variant: psycopg only returns jsonb as text,
+    and JSONField.from_db_value can't load an already decoded json list.
+    """
+
+    function = "JSON_AGG"
+    name = "JSONArrayAgg"
+    output_field = JSONField()
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        return self.as_sql(
+            compiler, connection, function="JSONB_AGG", **extra_context
+        )
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return self.as_sql(
+            compiler, connection, function="JSON_GROUP_ARRAY", **extra_context
+        )
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        return self.as_sql(
+            compiler, connection, function="JSON_ARRAYAGG", **extra_context
+        )
@@ -0,0 +1,88 @@
+import jwt
+from django.utils.translation import gettext_lazy as _
+from jwt.algorithms import HMACAlgorithm
+from rest_framework_simplejwt.backends import TokenBackend
+from rest_framework_simplejwt.exceptions import (
+    TokenBackendError,
+    TokenBackendExpiredToken,
+)
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+
+class PreparedKeyHMACAlgorithm(HMACAlgorithm):
+    """
+    HMAC algorithm that validates and converts each secret only once.
+    PyJWT runs prepare_key() (including its PEM/SSH/DER sniffing) on every
+    encode and decode; the signing key never changes, so the result is kept.
+    """
+
+    def __init__(self, hash_alg):
+        super().__init__(hash_alg)
+        self.prepared_keys = {}
+
+    def prepare_key(self, key):
+        prepared = self.prepared_keys.get(key)
+        if prepared is None:
+            prepared = super().prepare_key(key)
+            self.prepared_keys[key] = prepared
+        return prepared
+
+
+class PreparedKeyPyJWT(jwt.PyJWT):
+    """
+    PyJWT instance whose own PyJWS verifies HS256 with PreparedKeyHMACAlgorithm.
+    PyJWT's module-level registry, used by everything else, is left alone.
+    """
+
+    def __init__(self, options=None):
+        super().__init__(options)
+        self._jws.unregister_algorithm("HS256")
+        self._jws.register_algorithm(
+            "HS256", PreparedKeyHMACAlgorithm(HMACAlgorithm.SHA256)
+        )
+
+
+class PreparedKeyTokenBackend(TokenBackend):
+    """TokenBackend that decodes through a private PreparedKeyPyJWT."""
+
+    pyjwt = PreparedKeyPyJWT()
+
+    def decode(self, token, verify=True):
+        try:
+            return self.pyjwt.decode(
+                token,
+                self.get_verifying_key(token),
+                algorithms=[self.algorithm],
+                audience=self.audience,
+                issuer=self.issuer,
+                leeway=self.get_leeway(),
+                options={
+                    "verify_aud": self.audience is not None,
+                    "verify_signature": verify,
+                },
+            )
+        except jwt.InvalidAlgorithmError as e:
+            raise TokenBackendError(_("Invalid algorithm specified")) from e
+        except jwt.ExpiredSignatureError as e:
+            raise TokenBackendExpiredToken(_("Token is expired")) from e
+        except jwt.InvalidTokenError as e:
+            raise TokenBackendError(_("Token is invalid")) from e
+
+
+class PreparedKeyAccessToken(AccessToken):
+    """
+    Access token checked by PreparedKeyTokenBackend. Listed in
+    SIMPLE_JWT["AUTH_TOKEN_CLASSES"] so JWTAuthentication validates with it.
+    """
+
+    _token_backend = PreparedKeyTokenBackend(
+        api_settings.ALGORITHM,
+        api_settings.SIGNING_KEY,
+        api_settings.VERIFYING_KEY,
+        api_settings.AUDIENCE,
+        api_settings.ISSUER,
+        api_settings.JWK_URL,
+        api_settings.LEEWAY,
+        api_settings.JSON_ENCODER,
+    )
@@ -0,0 +1,67 @@
+from django.core.cache import cache
+from django.db.models.base import DEFERRED
+from rest_framework import serializers
+
+
+class CachedPKRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    PrimaryKeyRelatedField that resolves ids from cached lookup rows.
+    The rows live under `cache_key` and have the shape CachedLookupMixin
+    stores (`queryset.values(*row_fields)`), so the field and the lookup
+    viewset share one cache entry. Ids missing from the cache fall back to
+    the usual queryset lookup and its error messages.
+    """
+
+    def __init__(self, cache_key, row_fields, cache_timeout=60 * 15, **kwargs):
+        self.cache_key = cache_key
+        self.row_fields = row_fields
+        self.cache_timeout = cache_timeout
+        super().__init__(**kwargs)
+
+    def get_cached_rows(self):
+        return cache.get_or_set(
+            self.cache_key,
+            lambda: list(self.get_queryset().values(*self.row_fields)),
+            self.cache_timeout,
+        )
+
+    def to_internal_value(self, data):
+        if self.pk_field is None and not isinstance(data, bool):
+            for row in self.get_cached_rows():
+                if str(row["id"]) == str(data):
+                    return self.build_instance(row)
+        return super().to_internal_value(data)
+
+    def build_instance(self, row):
+        """Instance built from a cached row as if it had been loaded from the database."""
+        queryset = self.get_queryset()
+        fields = queryset.model._meta.concrete_fields
+        return queryset.model.from_db(
+            queryset.db,
+            [field.attname for field in fields if field.attname in row],
+            [row.get(field.attname, DEFERRED) for field in fields],
+        )
+
+
+class BaseURIImageField(serializers.ImageField):
+    """
+    ImageField that prefixes storage URLs with the request's scheme and host.
+    The base is worked out once per request instead of running
+    build_absolute_uri() for every image; absolute storage URLs are kept.
+    """
+
+    base_request = None
+    base_uri = ""
+
+    def to_representation(self, value):
+        if not value:
+            return None
+
+        url = value.url
+        request = self.context.get("request")
+        if request is None or not url.startswith("/") or url.startswith("//"):
+            return url
+        if self.base_request is not request:
+            self.base_request = request
+            self.base_uri = request.build_absolute_uri("/")[:-1]
+        return self.base_uri + url
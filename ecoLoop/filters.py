@@ -0,0 +1,21 @@
+from django_filters.rest_framework import DjangoFilterBackend
+
+
+class QueryParamFilterBackend(DjangoFilterBackend):
+    """
+    DjangoFilterBackend that only builds the FilterSet when the request
+    sends one of its parameters. Unfiltered list requests, the common case,
+    skip copying the filters and building and validating the filter form.
+    Parameters are matched by prefix so suffixed range widgets (`_min`,
+    `_after`, ...) still count.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        filterset_class = self.get_filterset_class(view, queryset)
+        if filterset_class is None:
+            return queryset
+
+        names = tuple(filterset_class.base_filters)
+        if not any(param.startswith(names) for param in request.query_params):
+            return queryset
+        return super().filter_queryset(request, queryset, view)
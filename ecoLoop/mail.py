@@ -1,17 +1,96 @@
-from django.core.mail import send_mail
-from django.conf import settings
-
-
-def send_email(email: str, subject: str, message: str):
-
-    send_mail(
-        subject, message, settings.DEFAULT_FROM_EMAIL, [email], fail_silently=False
-    )
+import atexit
+import smtplib
+import threading
 
-
-def send_login_otp(email: str, otp: str):
-    subject = "Your Login OTP"
-    message = f"""Hello,
+from django.core.mail import EmailMessage
+from django.core.mail.backends import smtp
+from django.conf import settings
+from django.db import transaction
+
+from .mail_queue import enqueue_email
+
+
+class PersistentSMTPBackend(smtp.EmailBackend):
+    """
+    SMTP backend that keeps one authenticated connection per thread and
+    reuses it across sends instead of doing TLS + AUTH for every email.
+    A NOOP checks the connection before reuse, and it is recycled after
+    EMAIL_MAX_MESSAGES_PER_CONNECTION messages.
+    """
+
+    local = threading.local()
+    open_connections = set()
+    lock = threading.Lock()
+
+    def open(self):
+        connection = getattr(self.local, "connection", None)
+        if connection is not None:
+            max_messages = getattr(settings, "EMAIL_MAX_MESSAGES_PER_CONNECTION", 100)
+            if self.local.sent >= max_messages:
+                self.retire(connection)
+            else:
+                try:
+                    connection.noop()
+                    self.connection = connection
+                    return False
+                except (smtplib.SMTPException, OSError):
+                    # Server dropped the idle connection, open a fresh one
+                    self.forget(connection)
+
+        opened = super().open()
+        if self.connection is not None:
+            self.local.connection = self.connection
+            self.local.sent = 0
+            with self.lock:
+                self.open_connections.add(self.connection)
+        return opened
+
+    def close(self):
+        # Keep the connection open for the next send on this thread
+        self.connection = None
+
+    def _send(self, email_message):
+        sent = super()._send(email_message)
+        if sent:
+            self.local.sent = getattr(self.local, "sent", 0) + 1
+        return sent
+
+    @classmethod
+    def retire(cls, connection):
+        try:
+            connection.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        cls.forget(connection)
+
+    @classmethod
+    def forget(cls, connection):
+        if getattr(cls.local, "connection", None) is connection:
+            cls.local.connection = None
+        with cls.lock:
+            cls.open_connections.discard(connection)
+
+    @classmethod
+    def close_all(cls):
+        """Politely QUIT every open connection on interpreter shutdown."""
+        with cls.lock:
+            connections = list(cls.open_connections)
+            cls.open_connections.clear()
+        for connection in connections:
+            try:
+                connection.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+
+
+atexit.register(PersistentSMTPBackend.close_all)
+
+
+# (subject, body) pairs rendered with str.format_map
+EMAIL_TEMPLATES = {
+    "login": (
+        "Your Login OTP",
+        """Hello,
 
 Your OTP for login is: {otp}
 
@@ -20,15 +99,11 @@ This OTP will expire in 5 minutes. Please do not share this code with anyone.
 If you didn't request this, please ignore this email.
 
 Best regards,
-Eco Loop Team"""
-
-    send_email(email, subject, message)
-
-
-def send_registration_otp(email: str, otp: str):
-    """Send OTP for user registration."""
-    subject = "Verify Your Email Address"
-    message = f"""Welcome!
+Eco Loop Team""",
+    ),
+    "register": (
+        "Verify Your Email Address",
+        """Welcome!
 
 Thank you for registering. Your verification OTP is: {otp}
 
@@ -37,15 +112,11 @@ This OTP will expire in 5 minutes. Please enter this code to complete your regis
 If you didn't create an account, please ignore this email.
 
 Best regards,
-Eco Loop Team"""
-
-    send_email(email, subject, message)
-
-
-def send_password_reset_otp(email: str, otp: str):
-    """Send OTP for password reset."""
-    subject = "Password Reset Request"
-    message = f"""Hello,
+Eco Loop Team""",
+    ),
+    "password_reset": (
+        "Password Reset Request",
+        """Hello,
 
 We received a request to reset your password. Your OTP is: {otp}
 
@@ -54,15 +125,11 @@ This OTP will expire in 5 minutes. If you didn't request a password reset, pleas
 Your password will remain unchanged until you create a new one using this OTP.
 
 Best regards,
-Eco Loop Team"""
-
-    send_email(email, subject, message)
-
-
-def send_role_application_approved(email: str, full_name: str, role_type: str):
-    """Send notification when role application is approved."""
-    subject = f"Your {role_type} Application Has Been Approved!"
-    message = f"""Hello {full_name},
+Eco Loop Team""",
+    ),
+    "role_approved": (
+        "Your {role_type} Application Has Been Approved!",
+        """Hello {full_name},
 
 Congratulations! Your application for the {role_type} role has been approved.
 
@@ -75,6 +142,53 @@ This will refresh your permissions and give you access to all {role_type} featur
 Thank you for joining Eco Loop!
 
 Best regards,
-Eco Loop Team"""
+Eco Loop Team""",
+    ),
+}
 
-    send_email(email, subject, message)
+
+def send_email(email: str, subject: str, message: str):
+    """
+    Send the email right away. Failures raise, so OTP requests fail
+    instead of reporting success for a code that never arrives.
+    """
+    EmailMessage(subject, message, settings.DEFAULT_FROM_EMAIL, [email]).send(
+        fail_silently=False
+    )
+
+
+def queue_email(email: str, subject: str, message: str):
+    """
+    Queue a non-critical notification for background delivery once the
+    current transaction commits. Failures are retried a few times, then logged.
+    """
+    email_message = EmailMessage(subject, message, settings.DEFAULT_FROM_EMAIL, [email])
+    transaction.on_commit(lambda: enqueue_email(email_message))
+
+
+def render_email(kind: str, **context):
+    """(subject, body) of one of EMAIL_TEMPLATES rendered with the given context."""
+    subject, body = EMAIL_TEMPLATES[kind]
+    return subject.format_map(context), body.format_map(context)
+
+
+def send_login_otp(email: str, otp: str):
+    send_email(email, *render_email("login", otp=otp))
+
+
+def send_registration_otp(email: str, otp: str):
+    """Send OTP for user registration."""
+    send_email(email, *render_email("register", otp=otp))
+
+
+def send_password_reset_otp(email: str, otp: str):
+    """Send OTP for password reset."""
+    send_email(email, *render_email("password_reset", otp=otp))
+
+
+def send_role_application_approved(email: str, full_name: str, role_type: str):
+    """Queue a notification that a role application was approved."""
+    queue_email(
+        email,
+        *render_email("role_approved", full_name=full_name, role_type=role_type),
+    )
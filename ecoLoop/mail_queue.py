@@ -0,0 +1,143 @@
+import atexit
+import queue
+import threading
+import time
+
+from django.core import mail
+from loguru import logger
+
+
+BATCH_SIZE = 100
+MAX_WAIT_SECONDS = 1.0
+MAX_ATTEMPTS = 3
+RETRY_DELAY_SECONDS = 5.0
+
+# Entries are (EmailMessage, attempt) pairs
+email_queue = queue.Queue(maxsize=1000)
+
+# Entries the worker took off the queue and hasn't sent yet; flush() sends them
+pending = []
+
+_worker = None
+_worker_lock = threading.Lock()
+_send_lock = threading.Lock()
+
+
+def enqueue_email(message, attempt=1):
+    """Hand an EmailMessage to the background sender."""
+    start_worker()
+    try:
+        email_queue.put_nowait((message, attempt))
+    except queue.Full:
+        logger.warning("Email queue is full, sending inline")
+        send_now([(message, attempt)])
+
+
+def start_worker():
+    """Start the sender thread on first use."""
+    global _worker
+    if _worker is None:
+        with _worker_lock:
+            if _worker is None:
+                _worker = threading.Thread(
+                    target=run, name="mail-queue", daemon=True
+                )
+                _worker.start()
+
+
+def collect_batch():
+    """
+    Block for one entry, then gather more for up to MAX_WAIT_SECONDS.
+    Entries go straight into `pending` so flush() can still send them.
+    """
+    pending.append(email_queue.get())
+    deadline = time.monotonic() + MAX_WAIT_SECONDS
+    while len(pending) < BATCH_SIZE:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            pending.append(email_queue.get(timeout=remaining))
+        except queue.Empty:
+            break
+
+
+def send_batch(batch):
+    """
+    Send a batch over a single SMTP connection and return the entries that
+    weren't sent. Gives up on the rest of the batch once a third of it (and
+    at least three messages) failed, since the server is most likely
+    unavailable.
+    """
+    failed = []
+    done = 0
+    try:
+        with mail.get_connection() as connection:
+            for message, attempt in batch:
+                done += 1
+                try:
+                    connection.send_messages([message])
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to send email '{message.subject}' to {message.to}: {e}"
+                    )
+                    failed.append((message, attempt))
+                    if len(failed) >= 3 and len(failed) * 3 >= len(batch):
+                        break
+    except Exception:
+        logger.exception(f"Failed to send a batch of {len(batch)} emails")
+    return failed + batch[done:]
+
+
+def next_attempts(failed):
+    """Return the failed entries to try again and log the ones given up on."""
+    retries = []
+    for message, attempt in failed:
+        if attempt < MAX_ATTEMPTS:
+            retries.append((message, attempt + 1))
+        else:
+            logger.error(
+                f"Giving up on email '{message.subject}' to {message.to} "
+                f"after {attempt} attempts"
+            )
+    return retries
+
+
+def send_now(batch):
+    """Send entries inline, retrying failures up to MAX_ATTEMPTS times."""
+    while batch:
+        batch = next_attempts(send_batch(batch))
+
+
+def run():
+    while True:
+        collect_batch()
+        with _send_lock:
+            if not pending:
+                # flush() already sent them
+                continue
+            retries = next_attempts(send_batch(list(pending)))
+            pending.clear()
+            # Requeue under the lock so a concurrent flush() sees them
+            for message, attempt in retries:
+                enqueue_email(message, attempt)
+        if retries:
+            # Give the mail server a moment before the next attempt
+            time.sleep(RETRY_DELAY_SECONDS)
+
+
+def flush():
+    """Send what is still queued or held by the worker when the process exits."""
+    # Waits for a send in progress, so its messages don't go out twice
+    with _send_lock:
+        batch = list(pending)
+        pending.clear()
+        while True:
+            try:
+                batch.append(email_queue.get_nowait())
+            except queue.Empty:
+                break
+        send_now(batch)
+
+
+atexit.register(flush)
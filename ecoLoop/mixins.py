@@ -0,0 +1,181 @@
+import copy
+
+from django.core.cache import cache
+from rest_framework import serializers, status
+
+from .utils import api_response
+
+
+# Rows fetched per round trip when a whole queryset is serialized at once
+ITERATOR_CHUNK_SIZE = 500
+
+
+class CachedLookupMixin:
+    """
+    Serve list/retrieve of a small lookup table from the cache.
+    The rows are stored under `cache_key` and must be invalidated by the
+    model's post_save/post_delete receivers.
+    """
+
+    cache_key = None
+    cache_timeout = 60 * 15
+
+    def get_cached_rows(self):
+        fields = self.get_serializer_class().Meta.fields
+        return cache.get_or_set(
+            self.cache_key,
+            lambda: list(self.get_queryset().values(*fields)),
+            self.cache_timeout,
+        )
+
+    def list(self, request, *args, **kwargs):
+        return api_response(
+            result=self.get_cached_rows(),
+            is_success=True,
+            status_code=status.HTTP_200_OK,
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup = str(self.kwargs[self.lookup_url_kwarg or self.lookup_field])
+        for row in self.get_cached_rows():
+            if str(row["id"]) == lookup:
+                return api_response(
+                    result=row,
+                    is_success=True,
+                    status_code=status.HTTP_200_OK,
+                )
+
+        # Not cached: let get_object() raise the usual 404
+        instance = self.get_object()
+        serializer = self.get_serializer(instance)
+        return api_response(
+            result=serializer.data,
+            is_success=True,
+            status_code=status.HTTP_200_OK,
+        )
+
+
+class PaginatedResponseMixin:
+    """Wrap paginated (or plain) list results in the API response envelope"""
+
+    def _paginated(self, queryset, serialize=None):
+        if serialize is None:
+            serialize = lambda rows: self.get_serializer(rows, many=True).data
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            result = self.get_paginated_response(serialize(page)).data
+        else:
+            # Unpaginated: stream rows instead of caching the whole queryset
+            result = serialize(queryset.iterator(chunk_size=ITERATOR_CHUNK_SIZE))
+
+        return api_response(
+            result=result,
+            is_success=True,
+            status_code=status.HTTP_200_OK,
+        )
+
+
+class ReadOnlyAPIResponseMixin(PaginatedResponseMixin):
+    """List/retrieve actions that return the api_response envelope"""
+
+    def list(self, request, *args, **kwargs):
+        return self._paginated(self.filter_queryset(self.get_queryset()))
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        serializer = self.get_serializer(instance)
+        return api_response(
+            result=serializer.data,
+            is_success=True,
+            status_code=status.HTTP_200_OK,
+        )
+
+
+class APIResponseMixin(ReadOnlyAPIResponseMixin):
+    """
+    Full CRUD actions that return the api_response envelope.
+    Validation errors are returned as 400 with the serializer errors;
+    creation-time fields go in perform_create().
+    """
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+
+        if not serializer.is_valid():
+            return api_response(
+                result=None,
+                is_success=False,
+                error_message=serializer.errors,
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+
+        self.perform_create(serializer)
+
+        return api_response(
+            result=serializer.data,
+            is_success=True,
+            status_code=status.HTTP_201_CREATED,
+        )
+
+    def update(self, request, *args, **kwargs):
+        partial = kwargs.pop("partial", False)
+        instance = self.get_object()
+        serializer = self.get_serializer(instance, data=request.data, partial=partial)
+
+        if not serializer.is_valid():
+            return api_response(
+                result=None,
+                is_success=False,
+                error_message=serializer.errors,
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+
+        self.perform_update(serializer)
+
+        return api_response(
+            result=serializer.data,
+            is_success=True,
+            status_code=status.HTTP_200_OK,
+        )
+
+    def partial_update(self, request, *args, **kwargs):
+        kwargs["partial"] = True
+        return self.update(request, *args, **kwargs)
+
+    def destroy(self, request, *args, **kwargs):
+        instance = self.get_object()
+        self.perform_destroy(instance)
+
+        return api_response(
+            result={"message": "Deleted."},
+            is_success=True,
+            status_code=status.HTTP_204_NO_CONTENT,
+        )
+
+
+class CachedFieldsMixin:
+    """
+    Build a serializer's fields once per class instead of once per instance.
+    Each instance gets its own copies to bind: plain fields are copied
+    shallowly, nested serializers deeply so their children are not shared.
+    Only for serializers whose get_fields() doesn't depend on the instance
+    (context, request, initial data).
+    """
+
+    fields_cache = {}
+
+    def get_fields(self):
+        cls = type(self)
+        fields = CachedFieldsMixin.fields_cache.get(cls)
+        if fields is None:
+            fields = CachedFieldsMixin.fields_cache[cls] = super().get_fields()
+
+        return {
+            name: (
+                copy.deepcopy(field)
+                if isinstance(field, serializers.BaseSerializer)
+                else copy.copy(field)
+            )
+            for name, field in fields.items()
+        }
@@ -0,0 +1,144 @@
+import hashlib
+import time
+from functools import partial
+
+from django.core.cache import cache
+from django.core.paginator import EmptyPage, Paginator
+from django.db.models import Count, QuerySet, Window
+from django.db.models.query import ModelIterable, ValuesIterable
+from django.utils.functional import cached_property
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+COUNT_CACHE_TIMEOUT = 300
+COUNT_VERSION_CACHE_KEY = "drf-count-version:{}"
+
+
+def get_count_version(model):
+    return cache.get(COUNT_VERSION_CACHE_KEY.format(model._meta.label_lower), 0)
+
+
+def bump_count_version(model):
+    """Move the cached counts of every paginated `model` list to a new key."""
+    cache.set(
+        COUNT_VERSION_CACHE_KEY.format(model._meta.label_lower), time.time_ns(), None
+    )
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Django paginator that reads the total row count from the cache.
+    The count is recomputed and stored when `refresh` is set (first page)
+    or when nothing is cached yet. On the first page it comes from a
+    COUNT(*) OVER () window on the page query itself, so no separate
+    COUNT query is issued.
+    """
+
+    def __init__(self, *args, cache_key=None, refresh=True, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_key = cache_key
+        self.refresh = refresh
+
+    @cached_property
+    def count(self):
+        if self.cache_key is None:
+            return super().count
+
+        if not self.refresh:
+            count = cache.get(self.cache_key)
+            if count is not None:
+                return count
+
+        count = super().count
+        cache.set(self.cache_key, count, COUNT_CACHE_TIMEOUT)
+        return count
+
+    def validate_number(self, number):
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            if self.refresh or self.cache_key is None:
+                raise
+        # Writes the receivers don't see can leave a short cached count;
+        # recount once before reporting the page as missing
+        self.refresh = True
+        self.__dict__.pop("count", None)
+        self.__dict__.pop("num_pages", None)
+        return super().validate_number(number)
+
+    def can_window_count(self):
+        object_list = self.object_list
+        return (
+            self.refresh
+            and not self.orphans
+            and isinstance(object_list, QuerySet)
+            and object_list._iterable_class in (ModelIterable, ValuesIterable)
+            and not object_list.query.distinct
+            and not object_list.query.combinator
+        )
+
+    def page(self, number):
+        if not self.can_window_count():
+            return super().page(number)
+
+        # First page: fetch the rows and the total in one query
+        rows = list(
+            self.object_list.annotate(window_total=Window(Count("*")))[
+                : self.per_page
+            ]
+        )
+        count = 0
+        for row in rows:
+            if isinstance(row, dict):
+                count = row.pop("window_total")
+            else:
+                count = row.window_total
+
+        self.__dict__["count"] = count
+        if self.cache_key is not None:
+            cache.set(self.cache_key, count, COUNT_CACHE_TIMEOUT)
+        return self._get_page(rows, 1, self)
+
+
+class CachedCountPagination(PageNumberPagination):
+    """
+    Page number pagination that caches COUNT(*) per view, page parameter,
+    user and filter query string. Page 1 always recomputes the count,
+    deeper pages reuse it until the model's count version is bumped by its
+    post_save/post_delete receivers.
+    """
+
+    def get_count_cache_key(self, request, view=None, model=None):
+        params = request.query_params.copy()
+        params.pop(self.page_query_param, None)
+        user_id = getattr(request.user, "pk", None)
+        version = get_count_version(model) if model is not None else 0
+        signature = (
+            f"{view.__class__.__name__}:{self.page_query_param}:{user_id}:"
+            f"{version}:{params.urlencode()}"
+        )
+        digest = hashlib.md5(signature.encode()).hexdigest()
+        return f"drf-count:{digest}"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page_number = request.query_params.get(self.page_query_param, "1")
+        self.django_paginator_class = partial(
+            CachedCountPaginator,
+            cache_key=self.get_count_cache_key(
+                request, view, getattr(queryset, "model", None)
+            ),
+            refresh=page_number == "1",
+        )
+        return super().paginate_queryset(queryset, request, view)
+
+
+class CreatedAtCursorPagination(CursorPagination):
+    """
+    Keyset pagination over created_at, newest first. Each page seeks from
+    the previous cursor instead of counting or OFFSET-scanning the rows.
+    """
+
+    ordering = "-created_at"
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 100
@@ -111,6 +111,36 @@ DATABASES = {
     }
 }
 
+# Persistent connections only pay off on networked databases (Postgres/MySQL).
+# Each worker thread keeps one connection open, so keep
+# (gunicorn workers x threads) below the server's max_connections.
+if "sqlite" not in (os.getenv("DB_ENGINE") or ""):
+    DATABASES["default"]["CONN_MAX_AGE"] = int(os.getenv("DB_CONN_MAX_AGE", "60"))
+    DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+# List versions, ETags and cached counts are invalidated through the cache,
+# so every worker must share it. Without REDIS_CACHE_URL, DEBUG keeps the
+# per-process cache and everything else uses the Redis server that the
+# channel layer below already needs.
+REDIS_CACHE_URL = os.getenv("REDIS_CACHE_URL")
+if REDIS_CACHE_URL or not DEBUG:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_CACHE_URL or "redis://127.0.0.1:6379/1",
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
 # =============================================================================
 # AUTH
 # =============================================================================
@@ -159,12 +189,12 @@ REST_FRAMEWORK = {
         "rest_framework.permissions.IsAuthenticated",
     ],
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "ecoLoop.renderers.ORJSONRenderer",
     ],
     "DEFAULT_FILTER_BACKENDS": [
-        "django_filters.rest_framework.DjangoFilterBackend",
+        "ecoLoop.filters.QueryParamFilterBackend",
     ],
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    "DEFAULT_PAGINATION_CLASS": "ecoLoop.pagination.CachedCountPagination",
     "PAGE_SIZE": 12,
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "EXCEPTION_HANDLER": "ecoLoop.exceptions.custom_exception_handler",
@@ -185,6 +215,7 @@ SIMPLE_JWT = {
     "AUTH_HEADER_TYPES": ("Bearer",),
     "USER_ID_FIELD": "id",
     "USER_ID_CLAIM": "user_id",
+    "AUTH_TOKEN_CLASSES": ("ecoLoop.auth.PreparedKeyAccessToken",),
 }
 
 # =============================================================================
@@ -198,13 +229,17 @@ LOGS_DIR.mkdir(exist_ok=True)
 
 logger.remove()
 
+# Levels written to debug.log and the console; a frozenset keeps the per-record check cheap
+NON_ERROR_LEVELS = frozenset(("DEBUG", "INFO", "WARNING"))
+
 logger.add(
     LOGS_DIR / "debug.log",
     level="DEBUG",
     rotation="10 MB",
     retention="30 days",
-    compression="zip",
-    filter=lambda r: r["level"].name in ["DEBUG", "INFO", "WARNING"],
+    compression="gz",
+    filter=lambda r, levels=NON_ERROR_LEVELS: r["level"].name in levels,
+    enqueue=True,
 )
 
 logger.add(
@@ -212,9 +247,10 @@ logger.add(
     level="ERROR",
     rotation="10 MB",
     retention="30 days",
-    compression="zip",
+    compression="gz",
     backtrace=True,
     diagnose=True,
+    enqueue=True,
 )
 
 if DEBUG:
@@ -222,8 +258,9 @@ if DEBUG:
         sys.stderr,
         level="DEBUG",
         format="<green>{time:HH:mm:ss}</green> | <level>{level}</level> | {message}",
-        filter=lambda r: r["level"].name in ["DEBUG", "INFO", "WARNING"],
+        filter=lambda r, levels=NON_ERROR_LEVELS: r["level"].name in levels,
         colorize=True,
+        enqueue=True,
     )
 
 # =============================================================================
@@ -258,7 +295,11 @@ SPECTACULAR_SETTINGS = {
 # =============================================================================
 # EMAIL SETTINGS
 # =============================================================================
-EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+EMAIL_BACKEND = "ecoLoop.mail.PersistentSMTPBackend"
+# Gmail throttles long-lived sessions; reconnect after this many messages
+EMAIL_MAX_MESSAGES_PER_CONNECTION = int(
+    os.getenv("EMAIL_MAX_MESSAGES_PER_CONNECTION", "100")
+)
 EMAIL_HOST = "smtp.gmail.com"
 EMAIL_PORT = 587
 EMAIL_USE_TLS = True
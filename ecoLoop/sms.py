@@ -1,14 +1,31 @@
+import threading
+
 from django.conf import settings
 from twilio.rest import Client
 
 
-def send_sms(phone_number: str, message: str):
-    client = Client(
-        settings.TWILIO_ACCOUNT_SID,
-        settings.TWILIO_AUTH_TOKEN,
-    )
+_client = None
+_client_lock = threading.Lock()
+
 
-    msg = client.messages.create(
+def get_client():
+    """
+    Shared Twilio client, created on first use.
+    Reusing it keeps its HTTP session (and the TLS connection) alive between messages.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = Client(
+                    settings.TWILIO_ACCOUNT_SID,
+                    settings.TWILIO_AUTH_TOKEN,
+                )
+    return _client
+
+
+def send_sms(phone_number: str, message: str):
+    msg = get_client().messages.create(
         body=message,
         from_=settings.TWILIO_FROM_NUMBER,
         to=phone_number,
@@ -2,19 +2,33 @@ from rest_framework.response import Response
 from rest_framework import status
 
 
+# Shared defaults for the envelope; the empty tuple renders as [] and is never mutated
+EMPTY_ERRORS = ()
+HTTP_500 = status.HTTP_500_INTERNAL_SERVER_ERROR
+
+
+def build_api_envelope(
+    result=None,
+    is_success=False,
+    error_message=None,
+    status_code=HTTP_500,
+):
+    return {
+        "StatusCode": status_code,
+        "IsSuccess": is_success,
+        "ErrorMessage": error_message or EMPTY_ERRORS,
+        "Result": result,
+    }
+
+
 def api_response(
     result=None,
     is_success=False,
     error_message=None,
-    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+    status_code=HTTP_500,
 ):
     return Response(
-        {
-            "StatusCode": status_code,
-            "IsSuccess": is_success,
-            "ErrorMessage": error_message if error_message else [],
-            "Result": result,
-        },
+        build_api_envelope(result, is_success, error_message, status_code),
         status=status_code,
     )
 
@@ -42,6 +56,9 @@ def log_admin_action(
         reason: Reason for performing the action
         request: Django request object to extract IP address
 
+    The entry is saved right away, inside the caller's transaction when
+    there is one, so it is rolled back together with the action it records.
+
     Returns:
         AdminActivityLog object
 
@@ -58,7 +75,6 @@ def log_admin_action(
     """
     from accounts.models import AdminActivityLog
 
-
     return AdminActivityLog.objects.create(
         admin=admin,
         action=action,
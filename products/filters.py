@@ -1,11 +1,41 @@
+from django.core.cache import cache
 from django_filters import (
     FilterSet,
     ChoiceFilter,
-    ModelChoiceFilter,
     CharFilter,
     NumberFilter,
 )
-from .models import Product, Category, Condition
+from .models import (
+    Product,
+    Category,
+    Condition,
+    CATEGORY_CHOICES_CACHE_KEY,
+    CONDITION_CHOICES_CACHE_KEY,
+)
+
+
+CHOICES_CACHE_TIMEOUT = 60 * 15
+
+
+def active_choices(model, cache_key):
+    """(id, name) pairs of active rows, cached until the model changes."""
+    return cache.get_or_set(
+        cache_key,
+        lambda: list(
+            model.objects.filter(is_active=True)
+            .order_by("name")
+            .values_list("id", "name")
+        ),
+        CHOICES_CACHE_TIMEOUT,
+    )
+
+
+def category_choices():
+    return active_choices(Category, CATEGORY_CHOICES_CACHE_KEY)
+
+
+def condition_choices():
+    return active_choices(Condition, CONDITION_CHOICES_CACHE_KEY)
 
 
 class ProductStatusFilter(FilterSet):
@@ -14,14 +44,14 @@ class ProductStatusFilter(FilterSet):
         choices=Product.STATUS_CHOICES,
         label="Product Status",
     )
-    category = ModelChoiceFilter(
+    category = ChoiceFilter(
         field_name="category",
-        queryset=Category.objects.filter(is_active=True),
+        choices=category_choices,
         label="Category",
     )
-    condition = ModelChoiceFilter(
+    condition = ChoiceFilter(
         field_name="condition",
-        queryset=Condition.objects.filter(is_active=True),
+        choices=condition_choices,
         label="Condition",
     )
     search = CharFilter(
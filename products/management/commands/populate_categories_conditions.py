@@ -1,5 +1,13 @@
+from django.core.cache import cache
 from django.core.management.base import BaseCommand
-from products.models import Category, Condition
+from products.models import (
+    Category,
+    Condition,
+    CATEGORIES_CACHE_KEY,
+    CATEGORY_CHOICES_CACHE_KEY,
+    CONDITIONS_CACHE_KEY,
+    CONDITION_CHOICES_CACHE_KEY,
+)
 
 
 class Command(BaseCommand):
@@ -62,35 +70,18 @@ class Command(BaseCommand):
             },
         ]
 
-        # Create categories
-        created_categories = 0
-        for category_data in categories_data:
-            category, created = Category.objects.get_or_create(
-                name=category_data["name"],
-                defaults={"description": category_data["description"]},
-            )
-            if created:
-                created_categories += 1
-                self.stdout.write(
-                    self.style.SUCCESS(f'✓ Created category: "{category.name}"')
-                )
-            else:
-                self.stdout.write(f'- Category already exists: "{category.name}"')
-
-        # Create conditions
-        created_conditions = 0
-        for condition_data in conditions_data:
-            condition, created = Condition.objects.get_or_create(
-                name=condition_data["name"],
-                defaults={"description": condition_data["description"]},
-            )
-            if created:
-                created_conditions += 1
-                self.stdout.write(
-                    self.style.SUCCESS(f'✓ Created condition: "{condition.name}"')
-                )
-            else:
-                self.stdout.write(f'- Condition already exists: "{condition.name}"')
+        created_categories = self.create_missing(
+            Category,
+            categories_data,
+            "category",
+            [CATEGORIES_CACHE_KEY, CATEGORY_CHOICES_CACHE_KEY],
+        )
+        created_conditions = self.create_missing(
+            Condition,
+            conditions_data,
+            "condition",
+            [CONDITIONS_CACHE_KEY, CONDITION_CHOICES_CACHE_KEY],
+        )
 
         # Summary
         self.stdout.write("\n" + "=" * 50)
@@ -100,3 +91,27 @@ class Command(BaseCommand):
             )
         )
         self.stdout.write("=" * 50)
+
+    def create_missing(self, model, rows, label, cache_keys):
+        """
+        Insert rows whose name isn't taken yet with a single bulk_create.
+        bulk_create doesn't send post_save, so `cache_keys` are cleared here.
+        """
+        existing = set(
+            model.objects.filter(name__in=[row["name"] for row in rows]).values_list(
+                "name", flat=True
+            )
+        )
+        missing = [row for row in rows if row["name"] not in existing]
+        model.objects.bulk_create(
+            [model(**row) for row in missing], batch_size=500, ignore_conflicts=True
+        )
+        if missing:
+            cache.delete_many(cache_keys)
+
+        for row in rows:
+            if row["name"] in existing:
+                self.stdout.write(f'- {label.capitalize()} already exists: "{row["name"]}"')
+            else:
+                self.stdout.write(self.style.SUCCESS(f'✓ Created {label}: "{row["name"]}"'))
+        return len(missing)
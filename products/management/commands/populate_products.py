@@ -1,6 +1,13 @@
 from django.core.management.base import BaseCommand
-from products.models import Product, Category, Condition
+from products.models import (
+    Product,
+    Category,
+    Condition,
+    ProductImage,
+    bump_product_list_version,
+)
 from accounts.models import User
+from ecoLoop.pagination import bump_count_version
 import os
 
 
@@ -26,15 +33,13 @@ class Command(BaseCommand):
             return
 
         # Get categories and conditions
-        try:
-            electronics = Category.objects.get(name="Electronics")
-            furniture = Category.objects.get(name="Furniture")
-            clothing = Category.objects.get(name="Clothing")
-
-            like_new = Condition.objects.get(name="Like New")
-            fair = Condition.objects.get(name="Fair")
-            good = Condition.objects.get(name="Good")
-        except Category.DoesNotExist or Condition.DoesNotExist:
+        categories = Category.objects.in_bulk(
+            ["Electronics", "Furniture", "Clothing"], field_name="name"
+        )
+        conditions = Condition.objects.in_bulk(
+            ["Like New", "Fair", "Good"], field_name="name"
+        )
+        if len(categories) < 3 or len(conditions) < 3:
             self.stdout.write(
                 self.style.ERROR(
                     "✗ Categories or Conditions not found. Run populate_categories_conditions first"
@@ -42,6 +47,14 @@ class Command(BaseCommand):
             )
             return
 
+        electronics = categories["Electronics"]
+        furniture = categories["Furniture"]
+        clothing = categories["Clothing"]
+
+        like_new = conditions["Like New"]
+        fair = conditions["Fair"]
+        good = conditions["Good"]
+
         products_data = [
             {
                 "title": "iPhone 13 Pro",
@@ -165,29 +178,36 @@ class Command(BaseCommand):
             },
         ]
 
-        created_count = 0
-        for product_data in products_data:
-            product, created = Product.objects.get_or_create(
-                title=product_data["title"],
-                owner=owner,
-                defaults={
-                    "description": product_data["description"],
-                    "category": product_data["category"],
-                    "condition": product_data["condition"],
-                    "price": product_data["price"],
-                    "location": product_data["location"],
-                    "image": image_path,
-                    "product_type": "sell",
-                    "is_active": True,
-                },
-            )
-            if created:
-                created_count += 1
-                self.stdout.write(
-                    self.style.SUCCESS(f' Created product: "{product.title}"')
-                )
+        existing = set(
+            Product.objects.filter(
+                owner=owner, title__in=[row["title"] for row in products_data]
+            ).values_list("title", flat=True)
+        )
+        new_rows = [row for row in products_data if row["title"] not in existing]
+        Product.objects.bulk_create(
+            [Product(owner=owner, is_active=True, **row) for row in new_rows],
+            batch_size=500,
+        )
+
+        # Re-read the new products so this also works where bulk_create can't return ids
+        new_products = Product.objects.filter(
+            owner=owner, title__in=[row["title"] for row in new_rows]
+        ).only("id")
+        ProductImage.objects.bulk_create(
+            [ProductImage(product=product, image=image_path) for product in new_products],
+            batch_size=500,
+        )
+        if new_rows:
+            # bulk_create doesn't send post_save
+            bump_product_list_version()
+            bump_count_version(Product)
+
+        for row in products_data:
+            if row["title"] in existing:
+                self.stdout.write(f'- Product already exists: "{row["title"]}"')
             else:
-                self.stdout.write(f'- Product already exists: "{product.title}"')
+                self.stdout.write(self.style.SUCCESS(f' Created product: "{row["title"]}"'))
+        created_count = len(new_rows)
 
         # Summary
         self.stdout.write("\n" + "=" * 50)
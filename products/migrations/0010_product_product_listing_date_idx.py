@@ -0,0 +1,19 @@
+# Generated by Django 6.0 on 2026-10-16 06:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0009_remove_product_product_type_alter_product_status'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(condition=models.Q(('is_active', True), ('status', 'available')), fields=['-created_at'], name='product_listing_date_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 6.0 on 2026-10-16 06:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0011_product_products_pr_categor_75eeb5_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['owner', '-created_at'], name='products_pr_owner_i_6f16a7_idx'),
+        ),
+    ]
@@ -1,5 +1,19 @@
-from django.db import models
+import time
+
+from django.core.cache import cache
+from django.db import models, transaction
 from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from ecoLoop.pagination import bump_count_version
+
+
+CATEGORIES_CACHE_KEY = "products:categories"
+CONDITIONS_CACHE_KEY = "products:conditions"
+CATEGORY_CHOICES_CACHE_KEY = "products:category-choices"
+CONDITION_CHOICES_CACHE_KEY = "products:condition-choices"
+PRODUCT_LIST_VERSION_CACHE_KEY = "products:list-version"
 
 
 class Category(models.Model):
@@ -25,6 +39,25 @@ class Condition(models.Model):
         return self.name
 
 
+@receiver([post_save, post_delete], sender=Category)
+def clear_category_cache(sender, **kwargs):
+    """Drop the cached category list and choices whenever a category changes."""
+    cache.delete_many([CATEGORIES_CACHE_KEY, CATEGORY_CHOICES_CACHE_KEY])
+    bump_product_list_version()
+
+
+@receiver([post_save, post_delete], sender=Condition)
+def clear_condition_cache(sender, **kwargs):
+    """Drop the cached condition list and choices whenever a condition changes."""
+    cache.delete_many([CONDITIONS_CACHE_KEY, CONDITION_CHOICES_CACHE_KEY])
+    bump_product_list_version()
+
+
+def bump_product_list_version():
+    """Move cached product list pages to a new key so they are rebuilt."""
+    cache.set(PRODUCT_LIST_VERSION_CACHE_KEY, time.time_ns(), None)
+
+
 class Product(models.Model):
     STATUS_CHOICES = [
         ("available", "Available"),
@@ -73,6 +106,22 @@ class Product(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # The public listing only shows active, available products, newest first
+            models.Index(
+                fields=["-created_at"],
+                condition=models.Q(is_active=True, status="available"),
+                name="product_listing_date_idx",
+            ),
+            # ProductStatusFilter lookups
+            models.Index(fields=["category", "status"]),
+            models.Index(fields=["condition", "status"]),
+            models.Index(fields=["price"]),
+            # Per-owner listings (user products, "my items"), newest first
+            models.Index(fields=["owner", "-created_at"]),
+        ]
+
     def __str__(self):
         return f"{self.title} - {self.owner.email}"
 
@@ -88,3 +137,16 @@ class ProductImage(models.Model):
 
     def __str__(self):
         return f"Image for {self.product.title} uploaded at {self.uploaded_at}"
+
+
+@receiver([post_save, post_delete], sender=Product)
+@receiver([post_save, post_delete], sender=ProductImage)
+def clear_product_list_cache(sender, **kwargs):
+    """Product and image changes show up in the list, so rebuild its pages."""
+    bump_product_list_version()
+
+
+@receiver([post_save, post_delete], sender=Product)
+def bump_product_counts(sender, **kwargs):
+    """Recount the paginated product lists once the write commits."""
+    transaction.on_commit(lambda: bump_count_version(sender))
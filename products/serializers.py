@@ -1,27 +1,59 @@
+from django.db.models import Prefetch
+from django.utils.functional import cached_property
 from rest_framework import serializers
-from .models import Product, Category, Condition, ProductImage
+from ecoLoop.fields import BaseURIImageField, CachedPKRelatedField
+from ecoLoop.mixins import CachedFieldsMixin
+from .models import (
+    Product,
+    Category,
+    Condition,
+    ProductImage,
+    CATEGORIES_CACHE_KEY,
+    CONDITIONS_CACHE_KEY,
+    bump_product_list_version,
+)
 
 
-class CategorySerializer(serializers.ModelSerializer):
+def add_product_images(product, images):
+    """Save uploaded images for a product with a single bulk INSERT."""
+    if not images:
+        return
+
+    ProductImage.objects.bulk_create(
+        [ProductImage(product=product, image=image) for image in images],
+        batch_size=500,
+    )
+    # bulk_create sends no post_save, so refresh cached list pages here
+    bump_product_list_version()
+
+
+def prefetch_product_images():
+    # Ordered so images.first() is answered from the prefetch cache
+    return Prefetch("images", queryset=ProductImage.objects.order_by("id"))
+
+
+class CategorySerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Category
         fields = ["id", "name", "description"]
 
 
-class ConditionSerializer(serializers.ModelSerializer):
+class ConditionSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Condition
         fields = ["id", "name", "description"]
 
 
-class ProductImageSerializer(serializers.ModelSerializer):
+class ProductImageSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    image = BaseURIImageField()
+
     class Meta:
         model = ProductImage
         fields = ["id", "image", "uploaded_at"]
         read_only_fields = ["id", "uploaded_at"]
 
 
-class ProductListSerializer(serializers.ModelSerializer):
+class ProductListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Lightweight serializer for product list - returns first image only"""
 
     category = CategorySerializer(read_only=True)
@@ -50,7 +82,78 @@ class ProductListSerializer(serializers.ModelSerializer):
         return None
 
 
-class ProductSerializer(serializers.ModelSerializer):
+class ProductListValuesSerializer:
+    """
+    Builds the ProductListSerializer shape from .values() rows.
+    Expects the rows listed in `values`, with first_image annotated by
+    annotate_first_image(); skips per-row field binding for the list.
+    """
+
+    values = (
+        "id",
+        "title",
+        "category_id",
+        "category__name",
+        "category__description",
+        "condition_id",
+        "condition__name",
+        "condition__description",
+        "price",
+        "first_image",
+    )
+
+    price_field = serializers.DecimalField(max_digits=10, decimal_places=2)
+    image_storage = ProductImage._meta.get_field("image").storage
+
+    def __init__(self, rows, context=None):
+        self.rows = rows
+        self.context = context or {}
+
+    def to_price(self, value):
+        if value is None:
+            return None
+        return self.price_field.to_representation(value)
+
+    @cached_property
+    def base_uri(self):
+        """Scheme and host of the request, worked out once for every row."""
+        request = self.context.get("request")
+        if request:
+            return request.build_absolute_uri("/")[:-1]
+        return ""
+
+    def to_image_url(self, name):
+        if not name:
+            return None
+        url = self.image_storage.url(name)
+        if url.startswith("/") and not url.startswith("//"):
+            return self.base_uri + url
+        return url
+
+    @property
+    def data(self):
+        return [
+            {
+                "id": row["id"],
+                "title": row["title"],
+                "category": {
+                    "id": row["category_id"],
+                    "name": row["category__name"],
+                    "description": row["category__description"],
+                },
+                "condition": {
+                    "id": row["condition_id"],
+                    "name": row["condition__name"],
+                    "description": row["condition__description"],
+                },
+                "price": self.to_price(row["price"]),
+                "image": self.to_image_url(row["first_image"]),
+            }
+            for row in self.rows
+        ]
+
+
+class ProductSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     owner_email = serializers.EmailField(source="owner.email", read_only=True)
     owner_name = serializers.CharField(source="owner.full_name", read_only=True)
     owner_id = serializers.CharField(source="owner.id", read_only=True)
@@ -59,15 +162,19 @@ class ProductSerializer(serializers.ModelSerializer):
 
     # Display category and condition as nested objects
     category = CategorySerializer(read_only=True)
-    category_id = serializers.PrimaryKeyRelatedField(
-        queryset=Category.objects.filter(is_active=True),
+    category_id = CachedPKRelatedField(
+        cache_key=CATEGORIES_CACHE_KEY,
+        row_fields=CategorySerializer.Meta.fields,
+        queryset=Category.objects.filter(is_active=True).order_by("name"),
         write_only=True,
         source="category",
     )
 
     condition = ConditionSerializer(read_only=True)
-    condition_id = serializers.PrimaryKeyRelatedField(
-        queryset=Condition.objects.filter(is_active=True),
+    condition_id = CachedPKRelatedField(
+        cache_key=CONDITIONS_CACHE_KEY,
+        row_fields=ConditionSerializer.Meta.fields,
+        queryset=Condition.objects.filter(is_active=True).order_by("name"),
         write_only=True,
         source="condition",
     )
@@ -110,26 +217,54 @@ class ProductSerializer(serializers.ModelSerializer):
             "owner_id",
             "owner_email",
             "owner_name",
-            "owner_address1",
-            "owner_address2",
             "is_owner",
             "created_at",
             "updated_at",
         ]
 
-    def get_is_owner(self, obj):
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Load everything this serializer reads; list views must call it."""
+        product_fields = [field.name for field in Product._meta.concrete_fields]
+        # Only the owner, category and condition columns the serializer shows
+        related_fields = [
+            "owner__id",
+            "owner__email",
+            "owner__full_name",
+            *(f"category__{name}" for name in CategorySerializer.Meta.fields),
+            *(f"condition__{name}" for name in ConditionSerializer.Meta.fields),
+        ]
+        return (
+            queryset.select_related("owner", "category", "condition")
+            .only(*product_fields, *related_fields)
+            .prefetch_related(prefetch_product_images())
+        )
+
+    def get_fields(self):
+        fields = super().get_fields()
+        # ?thin=1 skips the nested images and their absolute URLs
+        request = self.context.get("request")
+        if getattr(request, "query_params", {}).get("thin") == "1":
+            fields.pop("images", None)
+        return fields
+
+    @cached_property
+    def current_user_id(self):
+        """Requesting user's id, looked up once rather than per product."""
         request = self.context.get("request")
         if not request or not request.user or not request.user.is_authenticated:
-            return False
-        return obj.owner_id == request.user.id
+            return None
+        return request.user.id
+
+    def get_is_owner(self, obj):
+        return self.current_user_id is not None and obj.owner_id == self.current_user_id
 
     def create(self, validated_data):
         uploaded_images = validated_data.pop("uploaded_images", [])
         product = Product.objects.create(**validated_data)
 
-        # Create ProductImage instances for each uploaded image
-        for image in uploaded_images:
-            ProductImage.objects.create(product=product, image=image)
+        # Create ProductImage instances for all uploaded images in one INSERT
+        add_product_images(product, uploaded_images)
 
         return product
 
@@ -143,7 +278,6 @@ class ProductSerializer(serializers.ModelSerializer):
         instance = super().update(instance, validated_data)
 
         # Add new images if provided
-        for image in uploaded_images:
-            ProductImage.objects.create(product=instance, image=image)
+        add_product_images(instance, uploaded_images)
 
         return instance
@@ -1,3 +1,60 @@
+from decimal import Decimal
+
+from django.core.cache import cache
 from django.test import TestCase
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from .models import Category, Condition, Product
+
+
+class ProductListCacheTests(TestCase):
+    url = "/api/product/products/"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(
+            email="owner@example.com",
+            full_name="Owner",
+            phone_number="9800000003",
+            password="pass1234",
+        )
+        cls.category = Category.objects.create(name="Books")
+        cls.condition = Condition.objects.create(name="Used")
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def create_product(self, title):
+        return Product.objects.create(
+            owner=self.owner,
+            title=title,
+            category=self.category,
+            condition=self.condition,
+            price=Decimal("250.00"),
+        )
+
+    def test_unchanged_list_is_not_modified(self):
+        self.create_product("Novel")
+        etag = self.client.get(self.url)["ETag"]
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_new_product_changes_the_etag_and_the_cached_page(self):
+        self.create_product("Novel")
+        first = self.client.get(self.url)
+        self.assertEqual(first.json()["Result"]["count"], 1)
+
+        self.create_product("Atlas")
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"])
 
-# Create your tests here.
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], first["ETag"])
+        result = response.json()["Result"]
+        self.assertEqual(result["count"], 2)
+        self.assertEqual(
+            [row["title"] for row in result["results"]], ["Atlas", "Novel"]
+        )
@@ -1,31 +1,77 @@
+import hashlib
+
+from django.core.cache import cache
+from django.db.models import OuterRef, Subquery
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from rest_framework import viewsets, status, generics
 from rest_framework.decorators import action
-from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.permissions import SAFE_METHODS, IsAuthenticated, AllowAny
 from rest_framework.response import Response
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from django_filters.rest_framework import DjangoFilterBackend
 
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import (
     extend_schema,
     extend_schema_view,
+    OpenApiParameter,
     OpenApiResponse,
 )
 
-from .models import Product, Category, Condition, ProductImage
+from .models import (
+    Product,
+    Category,
+    Condition,
+    ProductImage,
+    CATEGORIES_CACHE_KEY,
+    CONDITIONS_CACHE_KEY,
+    PRODUCT_LIST_VERSION_CACHE_KEY,
+)
 from .serializers import (
     ProductSerializer,
     ProductListSerializer,
+    ProductListValuesSerializer,
     CategorySerializer,
     ConditionSerializer,
 )
 from .filters import ProductStatusFilter
 from accounts.permissions import IsOwnerOrReadOnlyProduct
+from ecoLoop.mixins import (
+    ITERATOR_CHUNK_SIZE,
+    CachedLookupMixin,
+    PaginatedResponseMixin,
+)
+from ecoLoop.pagination import CachedCountPagination, CreatedAtCursorPagination
 from ecoLoop.utils import api_response
 from recycle.models import ScrapRequest
 from recycle.serializers import ScrapRequestSerializer
 from donations.models import DonationRequest
-from donations.serializers import DonationRequestSerializer
+from donations.serializers import DonationRequestValuesSerializer
+from donations.views import annotate_images_json
+
+
+PRODUCT_LIST_CACHE_TIMEOUT = 60
+PRODUCT_DETAIL_CACHE_TIMEOUT = 60 * 60
+
+
+def annotate_first_image(queryset):
+    """Attach each product's first image path as first_image."""
+    first_image = (
+        ProductImage.objects.filter(product=OuterRef("pk"))
+        .order_by("id")
+        .values("image")[:1]
+    )
+    return queryset.annotate(first_image=Subquery(first_image))
+
+
+def product_list_etag(request, *args, **kwargs):
+    """ETag for product list pages; changes whenever the list version is bumped."""
+    version = cache.get(PRODUCT_LIST_VERSION_CACHE_KEY)
+    if version is None:
+        return None
+    return f"products-list-{version}"
 
 
 @extend_schema_view(
@@ -40,31 +86,15 @@ from donations.serializers import DonationRequestSerializer
         responses={200: CategorySerializer},
     ),
 )
-class CategoryViewSet(viewsets.ReadOnlyModelViewSet):
+class CategoryViewSet(CachedLookupMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = CategorySerializer
     permission_classes = [AllowAny]
+    pagination_class = None
+    cache_key = CATEGORIES_CACHE_KEY
 
     def get_queryset(self):
         return Category.objects.filter(is_active=True).order_by("name")
 
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-        serializer = self.get_serializer(queryset, many=True)
-        return api_response(
-            result=serializer.data,
-            is_success=True,
-            status_code=status.HTTP_200_OK,
-        )
-
-    def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
-        serializer = self.get_serializer(instance)
-        return api_response(
-            result=serializer.data,
-            is_success=True,
-            status_code=status.HTTP_200_OK,
-        )
-
 
 @extend_schema_view(
     list=extend_schema(
@@ -78,38 +108,22 @@ class CategoryViewSet(viewsets.ReadOnlyModelViewSet):
         responses={200: ConditionSerializer},
     ),
 )
-class ConditionViewSet(viewsets.ReadOnlyModelViewSet):
+class ConditionViewSet(CachedLookupMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = ConditionSerializer
     permission_classes = [AllowAny]
+    pagination_class = None
+    cache_key = CONDITIONS_CACHE_KEY
 
     def get_queryset(self):
         return Condition.objects.filter(is_active=True).order_by("name")
 
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-        serializer = self.get_serializer(queryset, many=True)
-        return api_response(
-            result=serializer.data,
-            is_success=True,
-            status_code=status.HTTP_200_OK,
-        )
-
-    def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
-        serializer = self.get_serializer(instance)
-        return api_response(
-            result=serializer.data,
-            is_success=True,
-            status_code=status.HTTP_200_OK,
-        )
-
 
 @extend_schema(tags=["Product"])
 @extend_schema_view(
     list=extend_schema(
         summary="List products",
         description="List all active products.",
-        responses={200: ProductSerializer(many=True)},
+        responses={200: ProductListSerializer(many=True)},
     ),
     retrieve=extend_schema(
         summary="Get product detail",
@@ -139,7 +153,7 @@ class ConditionViewSet(viewsets.ReadOnlyModelViewSet):
         },
     ),
 )
-class ProductViewSet(viewsets.ModelViewSet):
+class ProductViewSet(PaginatedResponseMixin, viewsets.ModelViewSet):
     serializer_class = ProductSerializer
     permission_classes = [IsAuthenticated, IsOwnerOrReadOnlyProduct]
     authentication_classes = [JWTAuthentication]
@@ -148,6 +162,12 @@ class ProductViewSet(viewsets.ModelViewSet):
     filter_backends = [DjangoFilterBackend]
     filterset_class = ProductStatusFilter
 
+    def get_parsers(self):
+        # Reads carry no body worth negotiating; uploads need multipart/form
+        if self.request is not None and self.request.method in SAFE_METHODS:
+            return [JSONParser()]
+        return super().get_parsers()
+
     def get_permissions(self):
         """
         Allow list and retrieve for anyone.
@@ -163,63 +183,123 @@ class ProductViewSet(viewsets.ModelViewSet):
             return ProductListSerializer
         return ProductSerializer
 
-    def get_queryset(self):
-        # Return all products that are active and available
+    def get_available_products(self):
+        # All products that are active and available
+        return Product.objects.filter(
+            is_active=True, status="available"
+        ).order_by("-created_at")
 
-        return (
-            Product.objects.filter(
-                is_active=True, status="available"
-            )
-            .select_related("owner", "category", "condition")
-            .prefetch_related("images")
-            .order_by("-created_at")
-        )
+    def get_queryset(self):
+        queryset = self.get_available_products()
+        if self.action == "list":
+            # list() reads plain rows, see ProductListValuesSerializer
+            return queryset
+        return ProductSerializer.setup_eager_loading(queryset)
 
     def perform_create(self, serializer):
         # Save product with authenticated user as owner
         serializer.save(owner=self.request.user)
 
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        # Drop prefetched images so newly uploaded ones show up in the response
+        serializer.instance._prefetched_objects_cache = {}
+
     @extend_schema(
         summary="List sell products",
         description="List all active sell products. No authentication required. Pagination supported.",
-        responses={200: ProductSerializer(many=True)},
+        responses={200: ProductListSerializer(many=True)},
     )
+    @method_decorator(condition(etag_func=product_list_etag))
     def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            data = self.get_serializer(page, many=True).data
-            result = {
-                "count": getattr(self.paginator.page.paginator, "count", len(data)),
-                "next": self.paginator.get_next_link(),
-                "previous": self.paginator.get_previous_link(),
-                "results": data,
-            }
+        # The list is public and has no per-user fields, so pages are shared
+        version = cache.get(PRODUCT_LIST_VERSION_CACHE_KEY, 0)
+        digest = hashlib.md5(request.build_absolute_uri().encode()).hexdigest()
+        cache_key = f"products:list:{version}:{digest}"
+
+        result = cache.get(cache_key)
+        if result is not None:
             return api_response(
                 result=result,
                 is_success=True,
                 status_code=status.HTTP_200_OK,
             )
 
-        data = self.get_serializer(queryset, many=True).data
-        return api_response(
-            result=data,
-            is_success=True,
-            status_code=status.HTTP_200_OK,
+        # Plain rows for the list; the first image comes along as first_image
+        queryset = annotate_first_image(
+            self.filter_queryset(self.get_queryset())
+        ).values(*ProductListValuesSerializer.values)
+        context = self.get_serializer_context()
+        response = self._paginated(
+            queryset,
+            serialize=lambda rows: ProductListValuesSerializer(
+                rows, context=context
+            ).data,
         )
+        cache.set(cache_key, response.data["Result"], PRODUCT_LIST_CACHE_TIMEOUT)
+        return response
+
+    def get_detail_stamp(self):
+        """
+        (id, owner_id, updated_at, owner email, owner name) of the requested
+        product, or None when it isn't available. One small query that tells
+        whether a cached detail body is still current.
+        """
+        lookup = self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+        try:
+            return (
+                self.get_available_products()
+                .filter(id=lookup)
+                .values_list(
+                    "id", "owner_id", "updated_at", "owner__email", "owner__full_name"
+                )
+                .first()
+            )
+        except (TypeError, ValueError):
+            return None
+
+    def get_detail_cache_key(self, stamp):
+        # The list version moves with image, category and condition changes
+        version = cache.get(PRODUCT_LIST_VERSION_CACHE_KEY, 0)
+        thin = self.request.query_params.get("thin") == "1"
+        base_uri = self.request.build_absolute_uri("/")
+        signature = f"{stamp}:{version}:{thin}:{base_uri}"
+        digest = hashlib.md5(signature.encode()).hexdigest()
+        return f"products:detail:{stamp[0]}:{digest}"
 
     @extend_schema(
         summary="Get sell product detail",
         description="Retrieve a specific product by ID. No authentication required.",
+        parameters=[
+            OpenApiParameter(
+                name="thin",
+                type=OpenApiTypes.BOOL,
+                description="Pass 1 to leave out the images list.",
+            ),
+        ],
         responses={
             200: ProductSerializer,
             404: OpenApiResponse(description="Product not found."),
         },
     )
     def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
-        data = self.get_serializer(instance).data
+        stamp = self.get_detail_stamp()
+        if stamp is None:
+            # Let get_object() raise the usual 404
+            self.get_object()
+
+        cache_key = self.get_detail_cache_key(stamp)
+        data = cache.get(cache_key)
+        if data is None:
+            instance = self.get_object()
+            data = self.get_serializer(instance).data
+            cache.set(cache_key, data, PRODUCT_DETAIL_CACHE_TIMEOUT)
+        else:
+            # The cached body is shared by all users; is_owner is per request
+            data["is_owner"] = (
+                request.user.is_authenticated and request.user.id == stamp[1]
+            )
+
         return api_response(
             result=data,
             is_success=True,
@@ -341,11 +421,22 @@ class ProductViewSet(viewsets.ModelViewSet):
         )
 
 
+OWNER_LISTING_SECTIONS = ("products", "scrap_requests", "donation_requests")
+
+
 @extend_schema(tags=["Product"])
 @extend_schema_view(
     list=extend_schema(
         summary="List owner's all items",
         description="Retrieve all items owned by the authenticated user (products, scrap requests, and donation requests). Requires authentication.",
+        parameters=[
+            OpenApiParameter(
+                name=f"{section}_page",
+                type=OpenApiTypes.INT,
+                description=f"Page number for {section}. When given, {section} is returned as a paginated page instead of a full list.",
+            )
+            for section in OWNER_LISTING_SECTIONS
+        ],
         responses={200: OpenApiResponse(description="Combined list of products, scrap requests, and donation requests")},
     ),
 )
@@ -354,35 +445,71 @@ class GetOwnerProductsViewSet(viewsets.ReadOnlyModelViewSet):
     authentication_classes = [JWTAuthentication]
     http_method_names = ['get']  # Only allow GET requests
 
+    def list_section(self, section, item_type, queryset, serialize):
+        """
+        Serialize one section of the listing and return it with its row count.
+        The section is paginated only when the client sends `<section>_page`,
+        so existing callers keep getting full lists.
+        """
+        page_query_param = f"{section}_page"
+        if page_query_param not in self.request.query_params:
+            data = serialize(queryset.iterator(chunk_size=ITERATOR_CHUNK_SIZE))
+            page = None
+        else:
+            paginator = CachedCountPagination()
+            paginator.page_query_param = page_query_param
+            page = paginator.paginate_queryset(queryset, self.request, view=self)
+            data = serialize(page)
+
+        # Add type identifier to each item
+        for item in data:
+            item['item_type'] = item_type
+
+        if page is None:
+            return data, len(data)
+        return paginator.get_paginated_response(data).data, paginator.page.paginator.count
+
     def list(self, request, *args, **kwargs):
+        context = {'request': request}
+
         # Get all products
-        products = Product.objects.filter(owner=request.user).select_related("owner", "category", "condition").prefetch_related("images").order_by("-created_at")
-        product_data = ProductSerializer(products, many=True, context={'request': request}).data
-        
+        products = ProductSerializer.setup_eager_loading(Product.objects.filter(owner=request.user).order_by("-created_at"))
+        product_data, product_count = self.list_section(
+            "products",
+            "product",
+            products,
+            lambda rows: ProductSerializer(rows, many=True, context=context).data,
+        )
+
         # Get all scrap requests
-        scrap_requests = ScrapRequest.objects.filter(user=request.user).select_related("user", "category").prefetch_related("images").order_by("-request_date")
-        scrap_data = ScrapRequestSerializer(scrap_requests, many=True, context={'request': request}).data
-        
+        scrap_requests = ScrapRequestSerializer.setup_eager_loading(ScrapRequest.objects.filter(user=request.user).order_by("-request_date"))
+        scrap_data, scrap_count = self.list_section(
+            "scrap_requests",
+            "scrap",
+            scrap_requests,
+            lambda rows: ScrapRequestSerializer(rows, many=True, context=context).data,
+        )
+
         # Get all donation requests
-        donation_requests = DonationRequest.objects.filter(user=request.user).select_related("user", "category", "condition").prefetch_related("images").order_by("-request_date")
-        donation_data = DonationRequestSerializer(donation_requests, many=True, context={'request': request}).data
-        
-        # Add type identifier to each item
-        for item in product_data:
-            item['item_type'] = 'product'
-        for item in scrap_data:
-            item['item_type'] = 'scrap'
-        for item in donation_data:
-            item['item_type'] = 'donation'
-        
+        # Plain rows with images_json, so no separate images query
+        donation_requests = annotate_images_json(
+            DonationRequest.objects.filter(user=request.user).order_by("-request_date")
+        ).values(*DonationRequestValuesSerializer.values)
+        donation_data, donation_count = self.list_section(
+            "donation_requests",
+            "donation",
+            donation_requests,
+            lambda rows: DonationRequestValuesSerializer(rows, context=context).data,
+        )
+
         # Combine all items
         result = {
             "products": product_data,
             "scrap_requests": scrap_data,
             "donation_requests": donation_data,
-            "total_count": len(product_data) + len(scrap_data) + len(donation_data)
+            "total_count": product_count + scrap_count + donation_count
         }
-        
+
         return api_response(
             result=result,
             is_success=True,
@@ -391,39 +518,50 @@ class GetOwnerProductsViewSet(viewsets.ReadOnlyModelViewSet):
 
 
 @extend_schema(tags=["Product"])
-class GetUserProductsView(generics.ListAPIView):
+class GetUserProductsView(PaginatedResponseMixin, generics.ListAPIView):
     serializer_class = ProductSerializer
     permission_classes = [AllowAny]
     authentication_classes = [JWTAuthentication]
-    parser_classes = (MultiPartParser, FormParser, JSONParser)
+    parser_classes = (JSONParser,)
+    pagination_class = CreatedAtCursorPagination
     lookup_field = "user"
 
+    @property
+    def paginator(self):
+        """Page only when asked to, so callers without page_size/cursor get the full list."""
+        query_params = self.request.query_params
+        if "page_size" not in query_params and "cursor" not in query_params:
+            return None
+        return super().paginator
+
     def get_queryset(self):
         user_id = self.kwargs.get("user_id")
-        return (
-            Product.objects.filter(
-                owner=user_id,
-
-                is_active=True,
-                status="available",
-            )
-            .select_related("owner", "category", "condition")
-            .order_by("-created_at")
-        )
+        queryset = Product.objects.filter(
+            owner=user_id,
+            is_active=True,
+            status="available",
+        ).order_by("-created_at")
+        return ProductSerializer.setup_eager_loading(queryset)
 
     @extend_schema(
         summary="List user's sell products",
-        description="Retrieve all active sell products for a specific user. No authentication required. Pass user UUID in the URL.",
+        description="Retrieve all active sell products for a specific user. No authentication required. Pass user UUID in the URL. Send page_size to get cursor-paginated pages instead of the full list.",
+        parameters=[
+            OpenApiParameter(
+                name="page_size",
+                type=OpenApiTypes.INT,
+                description="Products per page (max 100). Turns on cursor pagination.",
+            ),
+            OpenApiParameter(
+                name="cursor",
+                type=OpenApiTypes.STR,
+                description="Cursor from the previous page's next/previous link.",
+            ),
+        ],
         responses={
             200: ProductSerializer(many=True),
             404: OpenApiResponse(description="User not found."),
         },
     )
     def get(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return api_response(
-            result=serializer.data,
-            is_success=True,
-            status_code=status.HTTP_200_OK,
-        )
+        return self._paginated(self.get_queryset())
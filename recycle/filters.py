@@ -1,5 +1,30 @@
-from django_filters import FilterSet, ChoiceFilter, ModelChoiceFilter, CharFilter
-from .models import ScrapCategory, ScrapRequest
+from django.core.cache import cache
+from django_filters import FilterSet, ChoiceFilter, CharFilter
+from .models import ScrapCategory, ScrapRequest, SCRAP_CATEGORY_CHOICES_CACHE_KEY
+
+
+CHOICES_CACHE_TIMEOUT = 60 * 15
+
+# weight_range value -> (label, lower bound, upper bound or None)
+WEIGHT_RANGES = {
+    "0-10": ("0 to 10 kg", 0, 10),
+    "10-20": ("10 to 20 kg", 10, 20),
+    "20+": ("20+ kg", 20, None),
+}
+WEIGHT_RANGE_CHOICES = [(value, label) for value, (label, _, _) in WEIGHT_RANGES.items()]
+
+
+def scrap_category_choices():
+    """(id, material_type) pairs, cached until a scrap category changes."""
+    return cache.get_or_set(
+        SCRAP_CATEGORY_CHOICES_CACHE_KEY,
+        lambda: list(
+            ScrapCategory.objects.order_by("material_type").values_list(
+                "id", "material_type"
+            )
+        ),
+        CHOICES_CACHE_TIMEOUT,
+    )
 
 
 class ScrapRequestFilter(FilterSet):
@@ -7,9 +32,9 @@ class ScrapRequestFilter(FilterSet):
     FilterSet for filtering scrap requests by category, condition, and weight range.
     """
 
-    category = ModelChoiceFilter(
+    category = ChoiceFilter(
         field_name="category",
-        queryset=ScrapCategory.objects.all(),
+        choices=scrap_category_choices,
         label="Category",
     )
     condition = ChoiceFilter(
@@ -20,11 +45,7 @@ class ScrapRequestFilter(FilterSet):
     weight_range = ChoiceFilter(
         field_name="weight_kg",
         method="filter_weight_range",
-        choices=[
-            ("0-10", "0 to 10 kg"),
-            ("10-20", "10 to 20 kg"),
-            ("20+", "20+ kg"),
-        ],
+        choices=WEIGHT_RANGE_CHOICES,
         label="Weight Range",
     )
 
@@ -36,10 +57,10 @@ class ScrapRequestFilter(FilterSet):
         """
         Custom filter method for weight ranges.
         """
-        if value == "0-10":
-            return queryset.filter(weight_kg__gte=0, weight_kg__lt=10)
-        elif value == "10-20":
-            return queryset.filter(weight_kg__gte=10, weight_kg__lt=20)
-        elif value == "20+":
-            return queryset.filter(weight_kg__gte=20)
-        return queryset
+        if value not in WEIGHT_RANGES:
+            return queryset
+        _, lower, upper = WEIGHT_RANGES[value]
+        lookups = {"weight_kg__gte": lower}
+        if upper is not None:
+            lookups["weight_kg__lt"] = upper
+        return queryset.filter(**lookups)
@@ -1,5 +1,12 @@
+from django.core.cache import cache
 from django.core.management.base import BaseCommand
-from recycle.models import ScrapCategory
+from django.db import transaction
+from recycle.models import (
+    ScrapCategory,
+    SCRAP_CATEGORIES_CACHE_KEY,
+    SCRAP_CATEGORY_CHOICES_CACHE_KEY,
+    bump_scrap_categories_version,
+)
 
 
 class Command(BaseCommand):
@@ -110,44 +117,62 @@ class Command(BaseCommand):
             },
         ]
 
-        # Create scrap rates
-        created_rates = 0
-        updated_rates = 0
+        # Create missing scrap rates and update changed ones in bulk
+        existing = {
+            rate.material_type: rate
+            for rate in ScrapCategory.objects.filter(
+                material_type__in=[
+                    rate_data["material_type"] for rate_data in scrap_rates_data
+                ]
+            )
+        }
+        to_create = []
+        to_update = []
+        # Report lines, written in one go once the rows are saved
+        report = []
 
         for rate_data in scrap_rates_data:
-            rate, created = ScrapCategory.objects.get_or_create(
-                material_type=rate_data["material_type"],
-                defaults={
-                    "rate_per_kg": rate_data["rate_per_kg"],
-                    "description": rate_data["description"],
-                },
-            )
-            if created:
-                created_rates += 1
-                self.stdout.write(
+            rate = existing.get(rate_data["material_type"])
+            if rate is None:
+                rate = ScrapCategory(**rate_data)
+                to_create.append(rate)
+                report.append(
                     self.style.SUCCESS(
                         f'✓ Created rate: "{rate.material_type}" - Rs.{rate.rate_per_kg}/kg'
                     )
                 )
-            else:
-                # Update existing rate if different
-                if (
-                    rate.rate_per_kg != rate_data["rate_per_kg"]
-                    or rate.description != rate_data["description"]
-                ):
-                    rate.rate_per_kg = rate_data["rate_per_kg"]
-                    rate.description = rate_data["description"]
-                    rate.save()
-                    updated_rates += 1
-                    self.stdout.write(
-                        self.style.WARNING(
-                            f'↻ Updated rate: "{rate.material_type}" - Rs.{rate.rate_per_kg}/kg'
-                        )
-                    )
-                else:
-                    self.stdout.write(
-                        f'- Rate already exists: "{rate.material_type}" - Rs.{rate.rate_per_kg}/kg'
+            elif (
+                rate.rate_per_kg != rate_data["rate_per_kg"]
+                or rate.description != rate_data["description"]
+            ):
+                rate.rate_per_kg = rate_data["rate_per_kg"]
+                rate.description = rate_data["description"]
+                to_update.append(rate)
+                report.append(
+                    self.style.WARNING(
+                        f'↻ Updated rate: "{rate.material_type}" - Rs.{rate.rate_per_kg}/kg'
                     )
+                )
+            else:
+                report.append(
+                    f'- Rate already exists: "{rate.material_type}" - Rs.{rate.rate_per_kg}/kg'
+                )
+
+        with transaction.atomic():
+            ScrapCategory.objects.bulk_create(to_create, batch_size=500)
+            ScrapCategory.objects.bulk_update(
+                to_update, ["rate_per_kg", "description"], batch_size=500
+            )
+        self.stdout.write("\n".join(report))
+        created_rates = len(to_create)
+        updated_rates = len(to_update)
+
+        if to_create or to_update:
+            # bulk_create/bulk_update don't send post_save
+            cache.delete_many(
+                [SCRAP_CATEGORIES_CACHE_KEY, SCRAP_CATEGORY_CHOICES_CACHE_KEY]
+            )
+            bump_scrap_categories_version()
 
         # Summary
         self.stdout.write("\n" + "=" * 50)
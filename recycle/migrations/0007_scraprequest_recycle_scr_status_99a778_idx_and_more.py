@@ -0,0 +1,23 @@
+# Generated by Django 6.0 on 2026-10-16 07:02
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recycle', '0006_rename_message_scrapoffer_notes_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='scraprequest',
+            index=models.Index(fields=['status', 'weight_kg'], name='recycle_scr_status_99a778_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='scraprequest',
+            index=models.Index(fields=['user', '-request_date'], name='recycle_scr_user_id_6a294d_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0 on 2026-10-16 07:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recycle', '0007_scraprequest_recycle_scr_status_99a778_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='scraprequest',
+            index=models.Index(fields=['status', '-request_date'], name='recycle_scr_status_85e7c4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='scraprequest',
+            index=models.Index(fields=['status', 'category', '-request_date'], name='recycle_scr_status_3232bf_idx'),
+        ),
+    ]
@@ -1,4 +1,17 @@
-from django.db import models
+import time
+
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from ecoLoop.pagination import bump_count_version
+
+
+SCRAP_CATEGORIES_CACHE_KEY = "recycle:categories"
+SCRAP_CATEGORY_CHOICES_CACHE_KEY = "recycle:category-choices"
+SCRAP_CATEGORIES_VERSION_CACHE_KEY = "recycle:categories-version"
+SCRAP_REQUESTS_VERSION_CACHE_KEY = "recycle:requests-version:{}"
 
 
 class ScrapCategory(models.Model):
@@ -13,6 +26,23 @@ class ScrapCategory(models.Model):
         return f"{self.material_type}: {self.rate_per_kg} per kg"
 
 
+@receiver([post_save, post_delete], sender=ScrapCategory)
+def clear_scrap_category_cache(sender, **kwargs):
+    """Drop the cached categories and choices whenever a scrap category changes."""
+    cache.delete_many([SCRAP_CATEGORIES_CACHE_KEY, SCRAP_CATEGORY_CHOICES_CACHE_KEY])
+    bump_scrap_categories_version()
+
+
+def bump_scrap_categories_version():
+    """Change the ETag of every scrap request list, which nests the categories."""
+    cache.set(SCRAP_CATEGORIES_VERSION_CACHE_KEY, time.time_ns(), None)
+
+
+def bump_scrap_requests_version(user_id):
+    """Change the ETag of one user's scrap request list."""
+    cache.set(SCRAP_REQUESTS_VERSION_CACHE_KEY.format(user_id), time.time_ns(), None)
+
+
 class ScrapRequest(models.Model):
     STATUS_CHOICES = [
         ("pending", "Pending"),
@@ -50,10 +80,38 @@ class ScrapRequest(models.Model):
     preferred_time_slot = models.CharField(max_length=20, choices=TIME_SLOT_CHOICES)
     condition = models.CharField(max_length=20, choices=CONDITION_CHOICES)
 
+    class Meta:
+        indexes = [
+            # Recycler feeds fix the status and list newest first;
+            # ScrapRequestFilter narrows them by category or weight
+            models.Index(fields=["status", "-request_date"]),
+            models.Index(fields=["status", "category", "-request_date"]),
+            models.Index(fields=["status", "weight_kg"]),
+            # Per-user listings, newest first
+            models.Index(fields=["user", "-request_date"]),
+        ]
+
     def __str__(self):
         return f"Scrap Request by {self.user.username} for {self.category.material_type} ({self.weight_kg} kg)"
 
 
+@receiver([post_save, post_delete], sender=ScrapRequest)
+def bump_owner_scrap_requests_version(sender, instance, **kwargs):
+    """
+    Bump the owner's list version once the write is committed, so a list
+    read during the transaction can't be cached under the new ETag.
+    Images are only written together with their request, which covers them.
+    """
+    user_id = instance.user_id
+    transaction.on_commit(lambda: bump_scrap_requests_version(user_id))
+
+
+@receiver([post_save, post_delete], sender=ScrapRequest)
+def bump_scrap_request_counts(sender, **kwargs):
+    """Recount the paginated scrap request lists once the write commits."""
+    transaction.on_commit(lambda: bump_count_version(sender))
+
+
 class ScrapImage(models.Model):
     scrap = models.ForeignKey(
         ScrapRequest,
@@ -1,14 +1,35 @@
+import uuid
+from datetime import timezone as dt_timezone
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import OuterRef, Prefetch, Subquery
+from django.db.models.functions import JSONObject
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.functional import cached_property
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
-from recycle.models import ScrapCategory, ScrapRequest, ScrapImage, ScrapOffer
+from ecoLoop.aggregates import JSONArrayAgg
+from ecoLoop.fields import BaseURIImageField
+from accounts.serializers import UserDetailsSerializer
+from recycle.models import (
+    ScrapCategory,
+    ScrapRequest,
+    ScrapImage,
+    ScrapOffer,
+    SCRAP_CATEGORIES_CACHE_KEY,
+)
+
 
+SCRAP_CATEGORIES_CACHE_TIMEOUT = 60 * 15
 
-class UserDetailsSerializer(serializers.Serializer):
-    """Serializer for displaying user details"""
 
-    id = serializers.UUIDField(read_only=True)
-    full_name = serializers.CharField(read_only=True)
-    email = serializers.EmailField(read_only=True)
-    phone_number = serializers.CharField(read_only=True)
+def prefetch_scrap_images():
+    # Only the columns ScrapImageSerializer renders, plus the key to attach them
+    images = ScrapImage.objects.only("scrap_id", "id", "image", "uploaded_at")
+    return Prefetch("images", queryset=images.order_by("id"))
 
 
 class ScrapCategorySerializer(serializers.ModelSerializer):
@@ -16,8 +37,59 @@ class ScrapCategorySerializer(serializers.ModelSerializer):
         model = ScrapCategory
         fields = ["id", "material_type", "rate_per_kg", "description"]
 
+    def to_representation(self, instance):
+        # Nested in every scrap request row; read the attributes directly
+        return {
+            "id": instance.id,
+            "material_type": instance.material_type,
+            "rate_per_kg": self.fields["rate_per_kg"].to_representation(
+                instance.rate_per_kg
+            ),
+            "description": instance.description,
+        }
+
+
+def scrap_category_rows():
+    """
+    Serialized scrap categories, cached under SCRAP_CATEGORIES_CACHE_KEY.
+    Shared by the category endpoints and the nested category_details.
+    """
+    return cache.get_or_set(
+        SCRAP_CATEGORIES_CACHE_KEY,
+        lambda: list(
+            ScrapCategorySerializer(ScrapCategory.objects.all(), many=True).data
+        ),
+        SCRAP_CATEGORIES_CACHE_TIMEOUT,
+    )
+
+
+@extend_schema_field(ScrapCategorySerializer)
+class CachedScrapCategoryField(serializers.Field):
+    """
+    Nested category of a scrap request, looked up by category_id in the
+    cached category rows. The rows are read once per serializer, so the
+    request query needs no category join; unknown ids fall back to the relation.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs["source"] = "*"
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    @cached_property
+    def rows_by_id(self):
+        return {row["id"]: row for row in scrap_category_rows()}
+
+    def to_representation(self, value):
+        row = self.rows_by_id.get(value.category_id)
+        if row is None:
+            return ScrapCategorySerializer(value.category).data
+        return row
+
 
 class ScrapImageSerializer(serializers.ModelSerializer):
+    image = BaseURIImageField()
+
     class Meta:
         model = ScrapImage
         fields = ["id", "image", "uploaded_at"]
@@ -28,7 +100,7 @@ class ScrapRequestSerializer(serializers.ModelSerializer):
     user = serializers.PrimaryKeyRelatedField(read_only=True)
     request_date = serializers.DateTimeField(read_only=True)
     status = serializers.CharField(read_only=True)
-    category_details = ScrapCategorySerializer(source="category", read_only=True)
+    category_details = CachedScrapCategoryField()
 
     # Multiple images support
     images = ScrapImageSerializer(many=True, read_only=True)
@@ -57,13 +129,20 @@ class ScrapRequestSerializer(serializers.ModelSerializer):
             "uploaded_images",
         ]
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Load the images this serializer reads; list views must call it."""
+        return queryset.prefetch_related(prefetch_scrap_images())
+
     def create(self, validated_data):
         uploaded_images = validated_data.pop("uploaded_images", [])
-        request = ScrapRequest.objects.create(**validated_data)
-
-        # Create ScrapImage instances for each uploaded image
-        for image in uploaded_images:
-            ScrapImage.objects.create(scrap=request, image=image)
+        with transaction.atomic():
+            request = ScrapRequest.objects.create(**validated_data)
+            # Create ScrapImage instances for all uploaded images in one INSERT
+            ScrapImage.objects.bulk_create(
+                [ScrapImage(scrap=request, image=image) for image in uploaded_images],
+                batch_size=50,
+            )
 
         return request
 
@@ -74,7 +153,7 @@ class RecyclerScrapRequestSerializer(serializers.ModelSerializer):
     user_details = UserDetailsSerializer(source="user", read_only=True)
     request_date = serializers.DateTimeField(read_only=True)
     status = serializers.CharField(read_only=True)
-    category_details = ScrapCategorySerializer(source="category", read_only=True)
+    category_details = CachedScrapCategoryField()
     images = ScrapImageSerializer(many=True, read_only=True)
 
     class Meta:
@@ -95,6 +174,19 @@ class RecyclerScrapRequestSerializer(serializers.ModelSerializer):
             "images",
         ]
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Load only the request, user and image columns this serializer reads."""
+        request_fields = [
+            name for name in cls.Meta.fields if name not in cls._declared_fields
+        ]
+        user_fields = [f"user__{name}" for name in UserDetailsSerializer().fields]
+        return (
+            queryset.select_related("user")
+            .only("user", "request_date", "status", *request_fields, *user_fields)
+            .prefetch_related(prefetch_scrap_images())
+        )
+
 
 class ScrapOfferSerializer(serializers.ModelSerializer):
     """Serializer for Recycler to create offers for scrap requests"""
@@ -118,15 +210,95 @@ class ScrapOfferSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "recycler", "offer_date", "status"]
 
 
+def annotate_offers_json(queryset):
+    """
+    Attach each request's offers as one JSON array (offers_json) so they are
+    loaded with the main query instead of a separate prefetch.
+    """
+    offers = (
+        ScrapOffer.objects.filter(scrap_request=OuterRef("pk"))
+        .order_by()
+        .values("scrap_request")
+        .annotate(
+            json=JSONArrayAgg(
+                JSONObject(
+                    id="id",
+                    scrap_request="scrap_request_id",
+                    recycler="recycler_id",
+                    offer_date="offer_date",
+                    offered_price="offered_price",
+                    pickup_date="pickup_date",
+                    notes="notes",
+                    status="status",
+                )
+            )
+        )
+        .values("json")
+    )
+    return queryset.annotate(offers_json=Subquery(offers))
+
+
+def offers_json_to_representation(offers):
+    """Render rows of the offers_json annotation like ScrapOfferSerializer"""
+    datetime_field = serializers.DateTimeField()
+    price_field = serializers.DecimalField(max_digits=10, decimal_places=2)
+
+    def to_datetime(value):
+        if value is None:
+            return None
+        parsed = parse_datetime(value)
+        if timezone.is_naive(parsed):
+            # SQLite stores naive UTC timestamps
+            parsed = timezone.make_aware(parsed, dt_timezone.utc)
+        return datetime_field.to_representation(parsed)
+
+    return [
+        {
+            "id": offer["id"],
+            "scrap_request": offer["scrap_request"],
+            # SQLite keeps UUIDs as bare hex
+            "recycler": str(uuid.UUID(str(offer["recycler"]))),
+            "offer_date": to_datetime(offer["offer_date"]),
+            "offered_price": price_field.to_representation(
+                Decimal(str(offer["offered_price"]))
+            ),
+            "pickup_date": to_datetime(offer["pickup_date"]),
+            "notes": offer["notes"],
+            "status": offer["status"],
+        }
+        for offer in sorted(offers or [], key=lambda offer: offer["id"])
+    ]
+
+
+@extend_schema_field(ScrapOfferSerializer(many=True))
+class ScrapOffersField(serializers.Field):
+    """
+    Offers of a scrap request. Reads the offers_json annotation when the
+    queryset provides it and falls back to the recycler_offers relation otherwise.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs["source"] = "*"
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        if hasattr(value, "offers_json"):
+            return offers_json_to_representation(value.offers_json)
+        return ScrapOfferSerializer(
+            value.recycler_offers.all(), many=True, context=self.context
+        ).data
+
+
 class RecyclerAcceptedScrapRequestSerializer(serializers.ModelSerializer):
     """Serializer for Recycler to view accepted scrap requests with user and offer details"""
 
     user_details = UserDetailsSerializer(source="user", read_only=True)
     request_date = serializers.DateTimeField(read_only=True)
     status = serializers.CharField(read_only=True)
-    category_details = ScrapCategorySerializer(source="category", read_only=True)
+    category_details = CachedScrapCategoryField()
     images = ScrapImageSerializer(many=True, read_only=True)
-    recycler_offers = ScrapOfferSerializer(many=True, read_only=True)
+    recycler_offers = ScrapOffersField()
 
     class Meta:
         model = ScrapRequest
@@ -146,3 +318,10 @@ class RecyclerAcceptedScrapRequestSerializer(serializers.ModelSerializer):
             "images",
             "recycler_offers",
         ]
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Recycler list loading plus the offers, aggregated into the same query."""
+        return annotate_offers_json(
+            RecyclerScrapRequestSerializer.setup_eager_loading(queryset)
+        )
@@ -1,3 +1,129 @@
+import uuid
+from decimal import Decimal
+
+from django.db import connection
 from django.test import TestCase
+from rest_framework.test import APIClient
+
+from accounts.models import Role, User
+from .models import ScrapCategory, ScrapOffer, ScrapRequest
+from .serializers import annotate_offers_json
+
+
+class RecycleTestMixin:
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email="seller@example.com",
+            full_name="Seller",
+            phone_number="9800000001",
+            password="pass1234",
+        )
+        cls.recycler = User.objects.create_user(
+            email="recycler@example.com",
+            full_name="Recycler",
+            phone_number="9800000002",
+            password="pass1234",
+        )
+        cls.category = ScrapCategory.objects.create(
+            material_type="Paper", rate_per_kg=Decimal("15.00")
+        )
+
+    def create_request(self, **kwargs):
+        kwargs.setdefault("user", self.user)
+        return ScrapRequest.objects.create(
+            category=self.category,
+            weight_kg=Decimal("4.50"),
+            pickup_address="Lalitpur",
+            preferred_time_slot="morning",
+            condition="clean",
+            **kwargs,
+        )
+
+
+class AnnotateOffersJSONTests(RecycleTestMixin, TestCase):
+    def test_offers_load_as_a_list(self):
+        scrap_request = self.create_request(status="accepted")
+        offer = ScrapOffer.objects.create(
+            scrap_request=scrap_request,
+            recycler=self.recycler,
+            offered_price=Decimal("60.00"),
+        )
+
+        row = annotate_offers_json(ScrapRequest.objects.all()).get()
+
+        self.assertEqual(len(row.offers_json), 1)
+        self.assertEqual(row.offers_json[0]["id"], offer.id)
+        self.assertEqual(uuid.UUID(row.offers_json[0]["recycler"]), self.recycler.id)
+
+    def test_postgres_aggregates_to_jsonb(self):
+        # psycopg only returns jsonb as text for JSONField to decode
+        query = annotate_offers_json(ScrapRequest.objects.all()).query
+        inner = query.annotations["offers_json"]
+        aggregate = inner.annotations["json"]
+
+        compiler = inner.get_compiler(connection=connection)
+        sql, _ = aggregate.as_postgresql(compiler, connection)
+
+        self.assertTrue(sql.startswith("JSONB_AGG("), sql)
+
+
+class RecyclerAcceptRequestTests(RecycleTestMixin, TestCase):
+    def setUp(self):
+        self.recycler.roles.add(Role.objects.get_or_create(name="RECYCLER")[0])
+        self.client = APIClient()
+        self.client.force_authenticate(self.recycler)
+        self.scrap_request = self.create_request()
+
+    def accept(self, request_id, **data):
+        data.setdefault("scrap_request", request_id)
+        data.setdefault("offered_price", "60.00")
+        return self.client.post(
+            f"/api/recycle/recycler/pending-requests/{request_id}/accept/",
+            data,
+            format="json",
+        )
+
+    def test_pending_feed_lists_pending_requests(self):
+        response = self.client.get("/api/recycle/recycler/pending-requests/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["Result"]["count"], 1)
+
+    def test_accept_locks_the_request_and_creates_an_offer(self):
+        response = self.accept(self.scrap_request.id)
+
+        self.assertEqual(response.status_code, 201)
+        self.scrap_request.refresh_from_db()
+        self.assertEqual(self.scrap_request.status, "accepted")
+        offer = ScrapOffer.objects.get()
+        self.assertEqual(offer.recycler, self.recycler)
+        self.assertEqual(offer.scrap_request, self.scrap_request)
+
+    def test_second_accept_is_rejected(self):
+        self.assertEqual(self.accept(self.scrap_request.id).status_code, 201)
+
+        response = self.accept(self.scrap_request.id)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json()["ErrorMessage"],
+            "Cannot accept request with status: accepted",
+        )
+        self.assertEqual(ScrapOffer.objects.count(), 1)
+
+    def test_invalid_offer_leaves_the_request_pending(self):
+        response = self.accept(self.scrap_request.id, offered_price="not a price")
+
+        self.assertEqual(response.status_code, 400)
+        self.scrap_request.refresh_from_db()
+        self.assertEqual(self.scrap_request.status, "pending")
+        self.assertFalse(ScrapOffer.objects.exists())
+
+    def test_unknown_request_is_not_found(self):
+        # The offer is validated first, so it has to name an existing request
+        response = self.accept(
+            self.scrap_request.id + 1000, scrap_request=self.scrap_request.id
+        )
 
-# Create your tests here.
+        self.assertEqual(response.status_code, 404)
@@ -1,50 +1,67 @@
+from django.core.cache import cache
+from django.db import transaction
 from django.shortcuts import render
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
-from recycle.models import ScrapCategory, ScrapRequest, ScrapOffer
+from recycle.models import (
+    ScrapCategory,
+    ScrapRequest,
+    ScrapOffer,
+    SCRAP_CATEGORIES_VERSION_CACHE_KEY,
+    SCRAP_REQUESTS_VERSION_CACHE_KEY,
+)
 from recycle.serializers import (
     ScrapCategorySerializer,
     ScrapRequestSerializer,
     RecyclerScrapRequestSerializer,
     ScrapOfferSerializer,
     RecyclerAcceptedScrapRequestSerializer,
+    scrap_category_rows,
 )
 from recycle.filters import ScrapRequestFilter
+from ecoLoop.mixins import CachedLookupMixin, PaginatedResponseMixin
 from ecoLoop.utils import api_response
 from accounts.permissions import IsRecycler
 
 # Create your views here.
 
 
-class ScrapCategoryViewSet(viewsets.ModelViewSet):
+def scrap_request_list_etag(request, *args, **kwargs):
+    """
+    ETag for a user's scrap request list; changes whenever one of their
+    requests or any scrap category is written.
+    """
+    user_id = getattr(request.user, "pk", None)
+    if user_id is None:
+        return None
+
+    requests_key = SCRAP_REQUESTS_VERSION_CACHE_KEY.format(user_id)
+    versions = cache.get_many([requests_key, SCRAP_CATEGORIES_VERSION_CACHE_KEY])
+    if requests_key not in versions:
+        return None
+    return (
+        f"scrap-requests-{user_id}-{versions[requests_key]}-"
+        f"{versions.get(SCRAP_CATEGORIES_VERSION_CACHE_KEY, 0)}"
+    )
+
+
+class ScrapCategoryViewSet(CachedLookupMixin, viewsets.ModelViewSet):
     authentication_classes = []
     permission_classes = [AllowAny]
     queryset = ScrapCategory.objects.all()
     serializer_class = ScrapCategorySerializer
 
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-        serializer = self.get_serializer(queryset, many=True)
-        return api_response(
-            result=serializer.data,
-            is_success=True,
-            status_code=status.HTTP_200_OK,
-        )
-
-    def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
-        serializer = self.get_serializer(instance)
-        return api_response(
-            result=serializer.data,
-            is_success=True,
-            status_code=status.HTTP_200_OK,
-        )
+    def get_cached_rows(self):
+        # Serialized rows, so rate_per_kg keeps its "15.00" string form
+        return scrap_category_rows()
 
 
-class ScrapRequestViewSet(viewsets.ModelViewSet):
+class ScrapRequestViewSet(PaginatedResponseMixin, viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
     serializer_class = ScrapRequestSerializer
     parser_classes = (MultiPartParser, FormParser, JSONParser)
@@ -52,36 +69,13 @@ class ScrapRequestViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         # Users can only see their own scrap requests
-        return (
-            ScrapRequest.objects.filter(user=self.request.user)
-            .prefetch_related("images")
-            .select_related("category")
+        return ScrapRequestSerializer.setup_eager_loading(
+            ScrapRequest.objects.filter(user=self.request.user).order_by("-request_date")
         )
 
+    @method_decorator(condition(etag_func=scrap_request_list_etag))
     def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            data = self.get_serializer(page, many=True).data
-            result = {
-                "count": getattr(self.paginator.page.paginator, "count", len(data)),
-                "next": self.paginator.get_next_link(),
-                "previous": self.paginator.get_previous_link(),
-                "results": data,
-            }
-            return api_response(
-                result=result,
-                is_success=True,
-                status_code=status.HTTP_200_OK,
-            )
-
-        data = self.get_serializer(queryset, many=True).data
-        return api_response(
-            result=data,
-            is_success=True,
-            status_code=status.HTTP_200_OK,
-        )
+        return self._paginated(self.filter_queryset(self.get_queryset()))
 
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
@@ -113,7 +107,9 @@ class ScrapRequestViewSet(viewsets.ModelViewSet):
         )
 
 
-class RecyclerScrapRequestViewSet(viewsets.ReadOnlyModelViewSet):
+class RecyclerScrapRequestViewSet(
+    PaginatedResponseMixin, viewsets.ReadOnlyModelViewSet
+):
     """
     ViewSet for Recycler users to view all pending scrap requests.
     Recyclers can list and retrieve pending scrap requests but cannot modify them.
@@ -126,36 +122,12 @@ class RecyclerScrapRequestViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_queryset(self):
         # Recycler can see all pending scrap requests
-        return (
-            ScrapRequest.objects.filter(status="Pending")
-            .prefetch_related("images")
-            .select_related("category", "user")
+        return RecyclerScrapRequestSerializer.setup_eager_loading(
+            ScrapRequest.objects.filter(status="pending").order_by("-request_date")
         )
 
     def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            data = self.get_serializer(page, many=True).data
-            result = {
-                "count": getattr(self.paginator.page.paginator, "count", len(data)),
-                "next": self.paginator.get_next_link(),
-                "previous": self.paginator.get_previous_link(),
-                "results": data,
-            }
-            return api_response(
-                result=result,
-                is_success=True,
-                status_code=status.HTTP_200_OK,
-            )
-
-        data = self.get_serializer(queryset, many=True).data
-        return api_response(
-            result=data,
-            is_success=True,
-            status_code=status.HTTP_200_OK,
-        )
+        return self._paginated(self.filter_queryset(self.get_queryset()))
 
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
@@ -174,27 +146,7 @@ class RecyclerScrapRequestViewSet(viewsets.ReadOnlyModelViewSet):
 
         """
 
-        # Get the scrap request without status filter to check if it exists
-        try:
-            scrap_request = ScrapRequest.objects.get(id=pk)
-        except ScrapRequest.DoesNotExist:
-            return api_response(
-                result=None,
-                is_success=False,
-                error_message="Scrap request not found",
-                status_code=status.HTTP_404_NOT_FOUND,
-            )
-
-        # Check if request is still pending
-        if scrap_request.status != "Pending":
-            return api_response(
-                result=None,
-                is_success=False,
-                error_message=f"Cannot accept request with status: {scrap_request.status}",
-                status_code=status.HTTP_400_BAD_REQUEST,
-            )
-
-        # Create the offer
+        # Validate the offer before taking the lock to keep it short
         offer_serializer = ScrapOfferSerializer(data=request.data)
         if not offer_serializer.is_valid():
             return api_response(
@@ -204,19 +156,42 @@ class RecyclerScrapRequestViewSet(viewsets.ReadOnlyModelViewSet):
                 status_code=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Update request status
-        scrap_request.status = "accepted"
-        scrap_request.save()
-
-        # Save the offer
-        offer = offer_serializer.save(
-            recycler=request.user, scrap_request=scrap_request
-        )
+        with transaction.atomic():
+            # Lock the row so two recyclers can't accept the same request
+            try:
+                scrap_request = (
+                    ScrapRequest.objects.select_for_update(of=("self",))
+                    .select_related("user")
+                    .get(id=pk)
+                )
+            except ScrapRequest.DoesNotExist:
+                return api_response(
+                    result=None,
+                    is_success=False,
+                    error_message="Scrap request not found",
+                    status_code=status.HTTP_404_NOT_FOUND,
+                )
+
+            # Check if request is still pending
+            if scrap_request.status != "pending":
+                return api_response(
+                    result=None,
+                    is_success=False,
+                    error_message=f"Cannot accept request with status: {scrap_request.status}",
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                )
+
+            # Update request status
+            scrap_request.status = "accepted"
+            scrap_request.save(update_fields=["status"])
+
+            # Save the offer
+            offer_serializer.save(recycler=request.user, scrap_request=scrap_request)
 
         return api_response(
             result={
                 "message": "Scrap request accepted successfully",
-                "offer": ScrapOfferSerializer(offer).data,
+                "offer": offer_serializer.data,
                 "request": RecyclerScrapRequestSerializer(scrap_request).data,
             },
             is_success=True,
@@ -224,61 +199,9 @@ class RecyclerScrapRequestViewSet(viewsets.ReadOnlyModelViewSet):
         )
 
 
-class RecyclerAcceptedScrapRequestViewSet(viewsets.ReadOnlyModelViewSet):
-    """
-    ViewSet for Recycler users to view accepted scrap requests.
-    Recyclers can list and retrieve accepted scrap requests with offer details.
-    Supports filtering by category, condition, and weight range.
-    """
-
-    permission_classes = [IsAuthenticated, IsRecycler]
-    serializer_class = RecyclerAcceptedScrapRequestSerializer
-    filterset_class = ScrapRequestFilter
-
-    def get_queryset(self):
-        # Recycler can see all accepted scrap requests
-        return (
-            ScrapRequest.objects.filter(status="accepted")
-            .prefetch_related("images", "recycler_offers")
-            .select_related("category", "user")
-        )
-
-    def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            data = self.get_serializer(page, many=True).data
-            result = {
-                "count": getattr(self.paginator.page.paginator, "count", len(data)),
-                "next": self.paginator.get_next_link(),
-                "previous": self.paginator.get_previous_link(),
-                "results": data,
-            }
-            return api_response(
-                result=result,
-                is_success=True,
-                status_code=status.HTTP_200_OK,
-            )
-
-        data = self.get_serializer(queryset, many=True).data
-        return api_response(
-            result=data,
-            is_success=True,
-            status_code=status.HTTP_200_OK,
-        )
-
-    def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
-        serializer = self.get_serializer(instance)
-        return api_response(
-            result=serializer.data,
-            is_success=True,
-            status_code=status.HTTP_200_OK,
-        )
-
-
-class RecyclerAcceptedScrapRequestViewSet(viewsets.ReadOnlyModelViewSet):
+class RecyclerAcceptedScrapRequestViewSet(
+    PaginatedResponseMixin, viewsets.ReadOnlyModelViewSet
+):
     """
     ViewSet for Recycler users to view accepted scrap requests.
     Recyclers can list and retrieve accepted scrap requests with offer details.
@@ -291,36 +214,12 @@ class RecyclerAcceptedScrapRequestViewSet(viewsets.ReadOnlyModelViewSet):
 
     def get_queryset(self):
         # Recycler can see all accepted scrap requests
-        return (
-            ScrapRequest.objects.filter(status="accepted")
-            .prefetch_related("images", "recycler_offers")
-            .select_related("category", "user")
+        return RecyclerAcceptedScrapRequestSerializer.setup_eager_loading(
+            ScrapRequest.objects.filter(status="accepted").order_by("-request_date")
         )
 
     def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            data = self.get_serializer(page, many=True).data
-            result = {
-                "count": getattr(self.paginator.page.paginator, "count", len(data)),
-                "next": self.paginator.get_next_link(),
-                "previous": self.paginator.get_previous_link(),
-                "results": data,
-            }
-            return api_response(
-                result=result,
-                is_success=True,
-                status_code=status.HTTP_200_OK,
-            )
-
-        data = self.get_serializer(queryset, many=True).data
-        return api_response(
-            result=data,
-            is_success=True,
-            status_code=status.HTTP_200_OK,
-        )
+        return self._paginated(self.filter_queryset(self.get_queryset()))
 
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()